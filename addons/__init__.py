@@ -1,3 +1,6 @@
+# The modules without bot dependencies come first, function.py imports them while lyrics is loading it
+from .settings import Settings
+from .cache import LRUCache
+from .frozen import FrozenDict, FrozenList, freeze
 from .lyrics import lyricsPlatform
-from .placeholders import Placeholders
-from .settings import Settings
\ No newline at end of file
+from .placeholders import Placeholders
\ No newline at end of file
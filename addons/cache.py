@@ -0,0 +1,95 @@
+import time
+
+from collections import OrderedDict
+from typing import (
+    Any,
+    Hashable,
+    Optional,
+    Set,
+    Tuple
+)
+
+class LRUCache:
+    """A size-bounded LRU cache where every entry expires `ttl` seconds after it was stored.
+       Pinned keys are never evicted or expired, e.g. guilds with an active player.
+    """
+    def __init__(self, max_size: int = 10000, ttl: float = 3600) -> None:
+        self._data: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._pinned: Set[Hashable] = set()
+        self._max_size: int = max_size
+        self._ttl: float = ttl
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"<LRUCache size={len(self)} pinned={len(self._pinned)} hits={self.hits} misses={self.misses} evictions={self.evictions}>"
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        # Pinned entries are moved to the end, so each entry is checked at most once
+        for _ in range(len(self._data)):
+            if len(self._data) <= self._max_size:
+                break
+
+            key = next(iter(self._data))
+            if key in self._pinned:
+                self._data.move_to_end(key)
+            else:
+                del self._data[key]
+                self.evictions += 1
+
+    def get(self, key: Hashable, default: Any = None) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        if entry[0] < time.monotonic():
+            if key not in self._pinned:
+                del self._data[key]
+                self.evictions += 1
+                self.misses += 1
+                return default
+            self._data[key] = (time.monotonic() + self._ttl, entry[1])
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def pop(self, key: Hashable, default: Any = None) -> Optional[Any]:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def pin(self, key: Hashable) -> None:
+        self._pinned.add(key)
+
+    def unpin(self, key: Hashable) -> None:
+        self._pinned.discard(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def pinned(self) -> int:
+        return len(self._pinned)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total * 100 if total else 0.0
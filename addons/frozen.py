@@ -0,0 +1,77 @@
+import copy
+
+from collections.abc import Mapping, Sequence
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Union
+)
+
+def freeze(value: Any) -> Any:
+    """Wraps dicts and lists into read-only views, other values are returned as they are."""
+    if isinstance(value, dict):
+        return FrozenDict(value)
+    if isinstance(value, list):
+        return FrozenList(value)
+    return value
+
+class FrozenDict(Mapping):
+    """A read-only view of a dict. Nested dicts and lists are wrapped when they are accessed,
+       so reading a cached document doesn't copy it. Use `copy()` to get a mutable deep copy.
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict) -> None:
+        self._data: Dict = data
+
+    def __getitem__(self, key: Any) -> Any:
+        return freeze(self._data[key])
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({self._data!r})"
+
+    def copy(self) -> Dict:
+        return copy.deepcopy(self._data)
+
+class FrozenList(Sequence):
+    """A read-only view of a list. Use `copy()` to get a mutable deep copy."""
+    __slots__ = ("_data",)
+
+    def __init__(self, data: List) -> None:
+        self._data: List = data
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return FrozenList(self._data[index])
+        return freeze(self._data[index])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._data
+
+    def __reversed__(self) -> Iterator[Any]:
+        return map(freeze, reversed(self._data))
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(freeze, self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, FrozenList):
+            other = other._data
+        return self._data == other
+
+    def __repr__(self) -> str:
+        return f"FrozenList({self._data!r})"
+
+    def copy(self) -> List:
+        return copy.deepcopy(self._data)
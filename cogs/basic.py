@@ -32,7 +32,7 @@ from function import (
     time as ctime,
     format_time,
     get_source,
-    get_user,
+    get_user_view,
     get_lang,
     truncate_string,
     cooldown_check,
@@ -98,7 +98,7 @@ class Basic(commands.Cog):
                     return []
         
         history: dict[str, str] = {}
-        for track_id in reversed(await get_user(interaction.user.id, "history")):
+        for track_id in reversed(await get_user_view(interaction.user.id, "history")):
             track_dict = voicelink.decode(track_id)
             history[track_dict["identifier"]] = track_dict
 
@@ -30,6 +30,7 @@ from function import (
     send,
     time as ctime,
     get_user,
+    get_user_view,
     update_user,
     check_roles,
     get_lang,
@@ -39,6 +40,7 @@ from function import (
     logger
 )
 
+from addons import FrozenDict
 from views import PlaylistView, InboxView, HelpView
 
 def assign_playlist_id(existed: list) -> str:
@@ -54,7 +56,7 @@ async def check_playlist_perms(user_id: int, author_id: int, d_id: str) -> dict:
     return playlist
 
 async def check_playlist(ctx: commands.Context, name: str = None, full: bool = False, share: bool = True) -> dict:
-    user = await get_user(ctx.author.id, 'playlist')
+    user = await get_user(ctx.author.id, 'playlist') if full else await get_user_view(ctx.author.id, 'playlist')
 
     await ctx.defer()
     if full:
@@ -93,7 +95,7 @@ class Playlists(commands.Cog, name="playlist"):
         self.description = "This is the Vocard playlist system. You can save your favorites and use Vocard to play on any server."
 
     async def playlist_autocomplete(self, interaction: discord.Interaction, current: str) -> list:
-        playlists_raw: dict[str, dict] = await get_user(interaction.user.id, 'playlist')
+        playlists_raw: FrozenDict = await get_user_view(interaction.user.id, 'playlist')
         playlists = [value['name'] for value in playlists_raw.values()] if playlists_raw else []
         if current:
             return [app_commands.Choice(name=p, value=p) for p in playlists if current in p]
@@ -414,9 +416,11 @@ class Playlists(commands.Cog, name="playlist"):
         if not 0 < position <= len(result['playlist']['tracks']):
             return await send(ctx, 'playlistPositionNotFound', position, name)
 
-        await update_user(ctx.author.id, {"$pull": {f'playlist.{result["id"]}.tracks': result['playlist']['tracks'][position - 1]}})
+        # The playlist is a view of the cached user, so read the track before the update changes it
+        track_id = result['playlist']['tracks'][position - 1]
+        await update_user(ctx.author.id, {"$pull": {f'playlist.{result["id"]}.tracks': track_id}})
         
-        track = voicelink.decode(result['playlist']['tracks'][position - 1])
+        track = voicelink.decode(track_id)
         await send(ctx, 'playlistRemoved', track.get("title"), ctx.author, name)
 
     @playlist.command(name="clear", aliases=get_aliases("clear"))
@@ -100,13 +100,14 @@ class Settings(commands.Cog, name="settings"):
     @settings.command(name="queue", aliases=get_aliases("queue"))
     @app_commands.choices(mode=[
         app_commands.Choice(name="FairQueue", value="FairQueue"),
+        app_commands.Choice(name="IndexedQueue", value="IndexedQueue"),
         app_commands.Choice(name="Queue", value="Queue")
     ])
     @commands.has_permissions(manage_guild=True)
     @commands.dynamic_cooldown(cooldown_check, commands.BucketType.guild)
     async def queue(self, ctx: commands.Context, mode: str):
         "Change to another type of queue mode."
-        mode = "FairQueue" if mode.lower() == "fairqueue" else "Queue"
+        mode = {"fairqueue": "FairQueue", "indexedqueue": "IndexedQueue"}.get(mode.lower(), "Queue")
         await update_settings(ctx.guild.id, {"$set": {"queueType": mode}})
         await send(ctx, "setqueue", mode)
 
@@ -202,6 +203,7 @@ class Settings(commands.Cog, name="settings"):
                 await player.controller.delete()
             except:
                 discord.ui.View.from_message(player.controller).stop()
+            player.controller = None
 
         await update_settings(ctx.guild.id, {"$set": {'controller': toggle}})
         await send(ctx, 'togglecontroller', await get_lang(ctx.guild.id, "enabled" if toggle else "disabled"))
@@ -313,6 +315,20 @@ class Settings(commands.Cog, name="settings"):
             inline=False
         )
 
+        track_cache = voicelink.NodePool._track_cache
+        embed.add_field(
+            name="💾 Cache Information",
+            value=f"```• TRACKS:  {len(track_cache)} cached\n" \
+                  f"• HITS:    {track_cache.hits} ({track_cache.hit_rate:.1f}%)\n" \
+                  f"• MISSES:  {track_cache.misses}, {track_cache.evictions} evicted\n" \
+                  f"• GUILDS:  {len(func.SETTINGS_BUFFER)} cached, {func.SETTINGS_BUFFER.pinned} pinned\n" \
+                  f"• G-HITS:  {func.SETTINGS_BUFFER.hits} ({func.SETTINGS_BUFFER.hit_rate:.1f}%), {func.SETTINGS_BUFFER.evictions} evicted\n" \
+                  f"• USERS:   {len(func.USERS_BUFFER)} cached\n" \
+                  f"• U-HITS:  {func.USERS_BUFFER.hits} ({func.USERS_BUFFER.hit_rate:.1f}%), {func.USERS_BUFFER.evictions} evicted\n" \
+                  f"• WARMUP:  {func.WARMUP_STATS['guilds']:.0f} guilds, {func.WARMUP_STATS['queries']:.0f} queries in {func.WARMUP_STATS['duration']:.2f}s```",
+            inline=False
+        )
+
         node: voicelink.Node
         for name, node in voicelink.NodePool._nodes.items():
             if node._available:
@@ -33,7 +33,7 @@ class Task(commands.Cog):
         self.bot = bot
         self.activity_update.start()
         self.player_check.start()
-        self.cache_cleaner.start()
+        self.history_flusher.start()
 
         self.current_act = 0
         self.placeholder = Placeholders(bot)
@@ -41,7 +41,7 @@ class Task(commands.Cog):
     def cog_unload(self):
         self.activity_update.cancel()
         self.player_check.cancel()
-        self.cache_cleaner.cancel()
+        self.history_flusher.cancel()
     
     @tasks.loop(minutes=10.0)
     async def activity_update(self):
@@ -105,10 +105,9 @@ class Task(commands.Cog):
             except Exception as e:
                 func.logger.error("Error occurred while checking the player!", exc_info=e)
     
-    @tasks.loop(hours=12.0)
-    async def cache_cleaner(self):
-        func.SETTINGS_BUFFER.clear()
-        func.USERS_BUFFER.clear()
+    @tasks.loop(seconds=30.0)
+    async def history_flusher(self):
+        await func.flush_history()
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(Task(bot))
\ No newline at end of file
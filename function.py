@@ -1,13 +1,18 @@
-import discord, json, os, copy, logging
+import discord, json, os, copy, logging, asyncio
 
 from discord.ext import commands
 from time import strptime
-from addons import Settings
+from addons import Settings, LRUCache, FrozenDict, FrozenList, freeze
 
 from typing import (
     Optional,
     Union,
     Dict,
+    List,
+    Tuple,
+    Callable,
+    Awaitable,
+    Iterable,
     Any
 )
 
@@ -15,6 +20,7 @@ from motor.motor_asyncio import (
     AsyncIOMotorClient,
     AsyncIOMotorCollection,
 )
+from pymongo import UpdateOne, ReturnDocument
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -31,8 +37,20 @@ USERS_DB: AsyncIOMotorCollection
 
 LANGS: dict[str, dict[str, str]] = {} #Stores all the languages in ./langs
 LOCAL_LANGS: dict[str, dict[str, str]] = {} #Stores all the localization languages in ./local_langs
-SETTINGS_BUFFER: dict[int, dict[str, Any]] = {} #Cache guild language
-USERS_BUFFER: dict[str, dict] = {}
+SETTINGS_BUFFER: LRUCache = LRUCache(max_size=10000, ttl=6 * 3600) #Cache guild settings, guilds with an active player are pinned
+USERS_BUFFER: LRUCache = LRUCache(max_size=5000, ttl=3600)
+USER_FRAGMENTS: LRUCache = LRUCache(max_size=20000, ttl=600) #Caches the top-level fields of users which are not fully loaded
+USER_VERSIONS: LRUCache = LRUCache(max_size=20000, ttl=600) #Counts the updates of users, so a field load which raced an update is not cached
+HISTORY_BUFFER: dict[int, list[str]] = {} #Stores the history pushes which are not written to the database yet
+HISTORY_LIMIT: int = 25
+HISTORY_FLUSH_LOCK: asyncio.Lock = asyncio.Lock()
+
+PENDING_LOADS: dict[Tuple[Any, ...], asyncio.Future] = {} #Stores the documents which are being loaded from the database
+WARMUP_PENDING: set[int] = set() #Stores the guilds which settings are waiting to be pre-loaded
+WARMUP_STATS: dict[str, float] = {"guilds": 0, "queries": 0, "duration": 0.0}
+WARMUP_CHUNK_SIZE: int = 500
+WARMUP_DELAY: float = 1
+_warmup_task: Optional[asyncio.Task] = None
 
 MISSING_TRANSLATOR: dict[str, list[str]] = {}
 
@@ -195,80 +213,304 @@ async def send(
         return await send_func(text, embed=embed, view=view, delete_after=delete_after, ephemeral=ephemeral, allowed_mentions=ALLOWED_MENTIONS)
     return await send_func(text, embed=embed, delete_after=delete_after, ephemeral=ephemeral, allowed_mentions=ALLOWED_MENTIONS)
 
-async def update_db(db: AsyncIOMotorCollection, tempStore: dict, filter: dict, data: dict) -> bool:
+_MISSING = object()
+
+def _contains(values: Any, item: Any) -> bool:
+    try:
+        return item in values
+    except TypeError:
+        # An unhashable item is never in a set of hashable values
+        return False
+
+def _pull_matcher(condition: Any) -> Callable[[Any], bool]:
+    if isinstance(condition, dict) and "$in" in condition:
+        values = condition["$in"]
+        try:
+            values = set(values)
+        except TypeError:
+            pass
+        return lambda item: _contains(values, item)
+
+    if isinstance(condition, dict):
+        return lambda item: isinstance(item, dict) and all(item.get(k, _MISSING) == v for k, v in condition.items())
+
+    return lambda item: item == condition
+
+def _is_valid_update(data: dict) -> bool:
+    for mode, action in data.items():
+        if mode not in ("$set", "$unset", "$inc", "$push", "$pull"):
+            return False
+
+        for value in action.values():
+            if not isinstance(value, dict):
+                continue
+            if mode == "$push" and "$each" in value and not set(value) <= {"$each", "$slice", "$position"}:
+                return False
+            if mode == "$pull" and any(key.startswith("$") for key in value) and set(value) != {"$in"}:
+                return False
+
+    return True
+
+def apply_update(document: dict, data: dict) -> bool:
+    """Applies a MongoDB update document to a cached document in place.
+       Returns False without changing anything if the update uses an unsupported operator.
+    """
+    if not _is_valid_update(data):
+        return False
+
     for mode, action in data.items():
         for key, value in action.items():
             cursors = key.split(".")
 
-            nested_data = tempStore
+            nested_data = document
             for c in cursors[:-1]:
-                nested_data = nested_data.setdefault(c, {})
+                nested_data = nested_data[int(c)] if isinstance(nested_data, list) else nested_data.setdefault(c, {})
+
+            field = int(cursors[-1]) if isinstance(nested_data, list) else cursors[-1]
 
             if mode == "$set":
-                try:
-                    nested_data[cursors[-1]] = value
-                except TypeError:
-                    nested_data[int(cursors[-1])] = value
+                nested_data[field] = value
 
             elif mode == "$unset":
-                nested_data.pop(cursors[-1], None)
+                if isinstance(nested_data, list):
+                    nested_data[field] = None
+                else:
+                    nested_data.pop(field, None)
 
             elif mode == "$inc":
-                nested_data[cursors[-1]] = nested_data.get(cursors[-1], 0) + value
+                nested_data[field] = (nested_data[field] if isinstance(nested_data, list) else nested_data.get(field, 0)) + value
 
             elif mode == "$push":
+                array: list = nested_data.setdefault(field, []) if isinstance(nested_data, dict) else nested_data[field]
                 if isinstance(value, dict) and "$each" in value:
-                    nested_data.setdefault(cursors[-1], []).extend(value["$each"][value.get("$slice", len(value["$each"])):])
-                else:
-                    nested_data.setdefault(cursors[-1], []).extend([value])
-                    
-            elif mode == "$push":
-                if isinstance(value, dict) and "$each" in value:
-                    nested_data.setdefault(cursors[-1], []).extend(value["$each"])
-                    nested_data[cursors[-1]] = nested_data[cursors[-1]][value.get("$slice", len(value["$each"])):]
+                    position = value.get("$position")
+                    if position is None:
+                        array.extend(value["$each"])
+                    else:
+                        array[position:position] = value["$each"]
+
+                    if (limit := value.get("$slice")) is not None:
+                        if limit >= 0:
+                            del array[limit:]
+                        else:
+                            del array[:limit]
                 else:
-                    nested_data.setdefault(cursors[-1], []).extend([value])
+                    array.append(value)
 
             elif mode == "$pull":
-                if cursors[-1] in nested_data:
-                    value = value.get("$in", []) if isinstance(value, dict) else [value]
-                    nested_data[cursors[-1]] = [item for item in nested_data[cursors[-1]] if item not in value]
-                    
-            else:
-                return False
+                array = nested_data.get(field) if isinstance(nested_data, dict) else nested_data[field]
+                if isinstance(array, list):
+                    matcher = _pull_matcher(value)
+                    array[:] = [item for item in array if not matcher(item)]
+
+    return True
+
+async def update_db(db: AsyncIOMotorCollection, tempStore: dict, filter: dict, data: dict) -> bool:
+    if not apply_update(tempStore, data):
+        return False
 
     result = await db.update_one(filter, data)
     return result.modified_count > 0
 
+async def _load_once(key: Tuple[Any, ...], loader: Callable[[], Awaitable[Any]]) -> Any:
+    """Shares a single database round trip between concurrent loads of the same document."""
+    if (future := PENDING_LOADS.get(key)) is None:
+        future = PENDING_LOADS[key] = asyncio.ensure_future(loader())
+        future.add_done_callback(lambda _: PENDING_LOADS.pop(key, None))
+
+    return await asyncio.shield(future)
+
+async def _load_settings(guild_id: int) -> dict[str, Any]:
+    settings = await SETTINGS_DB.find_one_and_update(
+        {"_id": guild_id},
+        {"$setOnInsert": {"_id": guild_id}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    if guild_id in SETTINGS_BUFFER:
+        # The settings were cached while the query was running, e.g. by the pre-warm, keep that dict
+        return SETTINGS_BUFFER.get(guild_id, settings)
+
+    SETTINGS_BUFFER[guild_id] = settings
+    return settings
+
 async def get_settings(guild_id:int) -> dict[str, Any]:
     settings = SETTINGS_BUFFER.get(guild_id, None)
-    if not settings:
-        settings = await SETTINGS_DB.find_one({"_id": guild_id})
-        if not settings:
-            await SETTINGS_DB.insert_one({"_id": guild_id})
-            
-        settings = SETTINGS_BUFFER[guild_id] = settings or {}
+    if settings is None:
+        settings = await _load_once(("settings", guild_id), lambda: _load_settings(guild_id))
     return settings
 
+async def prewarm_settings(guild_ids: Iterable[int]) -> int:
+    """Loads the settings of many guilds with one query per `WARMUP_CHUNK_SIZE` guilds and returns how many were cached.
+       Guilds without a settings document are created by `get_settings` when they are used.
+    """
+    guild_ids = [guild_id for guild_id in guild_ids if guild_id not in SETTINGS_BUFFER][:SETTINGS_BUFFER.max_size]
+    if not guild_ids:
+        return 0
+
+    loop = asyncio.get_running_loop()
+    start, loaded = loop.time(), 0
+    for index in range(0, len(guild_ids), WARMUP_CHUNK_SIZE):
+        async for settings in SETTINGS_DB.find({"_id": {"$in": guild_ids[index:index + WARMUP_CHUNK_SIZE]}}):
+            if settings["_id"] not in SETTINGS_BUFFER:
+                SETTINGS_BUFFER[settings["_id"]] = settings
+                loaded += 1
+        WARMUP_STATS["queries"] += 1
+
+    duration = loop.time() - start
+    WARMUP_STATS["guilds"] += loaded
+    WARMUP_STATS["duration"] += duration
+    logger.info(f"Pre-loaded the settings of {loaded} guilds in {duration:.2f}s.")
+    return loaded
+
+async def _run_settings_warmup() -> None:
+    while WARMUP_PENDING:
+        # Collect the guilds which become available around the same time
+        await asyncio.sleep(WARMUP_DELAY)
+        guild_ids = list(WARMUP_PENDING)
+        WARMUP_PENDING.clear()
+
+        try:
+            await prewarm_settings(guild_ids)
+        except Exception as e:
+            logger.error(f"Failed to pre-load the settings of {len(guild_ids)} guilds.", exc_info=e)
+
+def schedule_settings_warmup(guild_ids: Iterable[int]) -> None:
+    """Queues guilds for `prewarm_settings`, guilds queued within `WARMUP_DELAY` seconds are loaded together."""
+    global _warmup_task
+    if not settings.prewarm_settings:
+        return
+
+    WARMUP_PENDING.update(guild_ids)
+    if WARMUP_PENDING and (_warmup_task is None or _warmup_task.done()):
+        _warmup_task = asyncio.create_task(_run_settings_warmup())
+
 async def update_settings(guild_id: int, data: dict[str, dict[str, Any]]) -> bool:
     settings = await get_settings(guild_id)
     return await update_db(SETTINGS_DB, settings, {"_id": guild_id}, data)
             
-async def get_user(user_id: int, d_type: Optional[str] = None, need_copy: bool = True) -> Dict[str, Any]:
+async def _get_user_fields(user_id: int, fields: List[str]) -> Dict[str, Any]:
+    fragment = USER_FRAGMENTS.get(user_id) or {}
+    if missing := [field for field in fields if field not in fragment]:
+        version = USER_VERSIONS.get(user_id, 0)
+        data = await _load_once(
+            ("user_fields", user_id, *missing),
+            lambda: USERS_DB.find_one({"_id": user_id}, {field: 1 for field in missing})
+        )
+        if not data:
+            # Let the full load create the user
+            user = await get_user(user_id, need_copy=False)
+            return {field: user.setdefault(field, copy.deepcopy(USER_BASE.get(field))) for field in fields}
+
+        for field in missing:
+            fragment[field] = data.get(field, copy.deepcopy(USER_BASE.get(field)))
+
+        if "history" in missing and (track_ids := HISTORY_BUFFER.get(user_id)):
+            _apply_history(fragment["history"], track_ids)
+
+        if USER_VERSIONS.get(user_id, 0) == version:
+            USER_FRAGMENTS[user_id] = fragment
+
+    return {field: fragment[field] for field in fields}
+
+async def _load_user(user_id: int) -> Dict[str, Any]:
+    user = await USERS_DB.find_one_and_update(
+        {"_id": user_id},
+        {"$setOnInsert": copy.deepcopy(USER_BASE)},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+
+    if track_ids := HISTORY_BUFFER.get(user_id):
+        _apply_history(user.setdefault("history", []), track_ids)
+
+    USERS_BUFFER[user_id] = user
+    USER_FRAGMENTS.pop(user_id)
+    return user
+
+async def get_user(user_id: int, d_type: Optional[str] = None, need_copy: bool = True, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Returns the user data. With `fields`, only these top-level fields are returned and,
+       if the user is not cached yet, only they are loaded from the database.
+    """
+    if fields:
+        if user := USERS_BUFFER.get(user_id):
+            data = {field: user.setdefault(field, copy.deepcopy(USER_BASE.get(field))) for field in fields}
+        else:
+            data = await _get_user_fields(user_id, fields)
+        return copy.deepcopy(data) if need_copy else data
+
     user = USERS_BUFFER.get(user_id)
-    if not user:
-        user = await USERS_DB.find_one({"_id": user_id})
-        if not user:
-            user = {"_id": user_id, **USER_BASE}
-            await USERS_DB.insert_one(user)
-    
-        USERS_BUFFER[user_id] = user
+    if user is None:
+        user = await _load_once(("user", user_id), lambda: _load_user(user_id))
         
     if d_type:
         user = user.setdefault(d_type, copy.deepcopy(USER_BASE.get(d_type)))
             
     return copy.deepcopy(user) if need_copy else user
 
+async def get_user_view(user_id: int, d_type: Optional[str] = None) -> Union[FrozenDict, FrozenList]:
+    """Returns a read-only view of the cached user data, for callers which don't modify it.
+       A single `d_type` is loaded with a projection if the user is not cached yet.
+    """
+    if d_type:
+        return freeze((await get_user(user_id, need_copy=False, fields=[d_type]))[d_type])
+    return freeze(await get_user(user_id, need_copy=False))
+
 async def update_user(user_id:int, data:dict) -> bool:
+    USER_VERSIONS[user_id] = USER_VERSIONS.get(user_id, 0) + 1
+    USER_FRAGMENTS.pop(user_id)
     playlist = await get_user(user_id, need_copy=False)
-    return await update_db(USERS_DB, playlist, {"_id": user_id}, data)
\ No newline at end of file
+    return await update_db(USERS_DB, playlist, {"_id": user_id}, data)
+
+def _apply_history(history: list[str], track_ids: list[str]) -> None:
+    history.extend(track_ids)
+    del history[:-HISTORY_LIMIT]
+
+def push_history(user_id: int, track_id: str) -> None:
+    """Adds a track to the user's history. The database is updated in bulk by `flush_history`."""
+    HISTORY_BUFFER.setdefault(user_id, []).append(track_id)
+    if user := USERS_BUFFER.get(user_id):
+        _apply_history(user.setdefault("history", []), [track_id])
+
+    if (fragment := USER_FRAGMENTS.get(user_id)) and "history" in fragment:
+        _apply_history(fragment["history"], [track_id])
+
+async def flush_history() -> int:
+    """Writes the buffered history pushes with a single bulk write and returns the number of updated users."""
+    async with HISTORY_FLUSH_LOCK:
+        if not HISTORY_BUFFER:
+            return 0
+
+        # The pushes stay buffered until they are written, so users loaded in the meantime still get them
+        pending = {user_id: list(track_ids) for user_id, track_ids in HISTORY_BUFFER.items()}
+
+        base = {key: value for key, value in USER_BASE.items() if key != "history"}
+        requests = [
+            UpdateOne(
+                {"_id": user_id},
+                {
+                    "$push": {"history": {"$each": track_ids[-HISTORY_LIMIT:], "$slice": -HISTORY_LIMIT}},
+                    "$setOnInsert": base
+                },
+                upsert=True
+            )
+            for user_id, track_ids in pending.items()
+        ]
+
+        try:
+            await USERS_DB.bulk_write(requests, ordered=False)
+        except Exception as e:
+            # Keep the pushes for the next flush, only the latest ones end up in the history anyway
+            for track_ids in HISTORY_BUFFER.values():
+                del track_ids[:-HISTORY_LIMIT]
+            logger.error(f"Failed to flush the history of {len(pending)} users.", exc_info=e)
+            return 0
+
+        # Pushes made during the write were appended, so only the written ones are removed
+        for user_id, track_ids in pending.items():
+            if buffered := HISTORY_BUFFER.get(user_id):
+                del buffered[:len(track_ids)]
+                if not buffered:
+                    del HISTORY_BUFFER[user_id]
+
+        return len(requests)
\ No newline at end of file
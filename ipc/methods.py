@@ -636,7 +636,7 @@ async def getSettings(bot: commands.Bot, data: Dict) -> Dict:
         "settings": settings,
         "options": {
             "languages": list(func.LANGS.keys()),
-            "queue_modes": ["Queue", "FairQueue"],
+            "queue_modes": ["Queue", "FairQueue", "IndexedQueue"],
             "roles": [role.name for role in guild.roles]
         },
         "guild": {
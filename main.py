@@ -10,7 +10,7 @@ from discord.ext import commands
 from ipc import IPCClient
 from motor.motor_asyncio import AsyncIOMotorClient
 from logging.handlers import TimedRotatingFileHandler
-from voicelink import VoicelinkException
+from voicelink import Player, VoicelinkException
 from addons import Settings
 
 class Translator(discord.app_commands.Translator):
@@ -42,6 +42,10 @@ class Vocard(commands.Bot):
         self.ipc: IPCClient
 
     async def on_message(self, message: discord.Message, /) -> None:
+        # Let the player know about new messages in its controller channel
+        if message.guild and isinstance(player := message.guild.voice_client, Player):
+            player.track_message(message)
+
         # Ignore messages from bots or DMs
         if message.author.bot or not message.guild:
             return False
@@ -75,6 +79,11 @@ class Vocard(commands.Bot):
             
         await self.process_commands(message)
 
+    async def close(self) -> None:
+        # Write the buffered history before shutting down
+        await func.flush_history()
+        await super().close()
+
     async def connect_db(self) -> None:
         if not ((db_name := func.settings.mongodb_name) and (db_url := func.settings.mongodb_url)):
             raise Exception("MONGODB_NAME and MONGODB_URL can't not be empty in settings.json")
@@ -134,6 +143,10 @@ class Vocard(commands.Bot):
         func.settings.client_id = self.user.id
         func.LOCAL_LANGS.clear()
         func.MISSING_TRANSLATOR.clear()
+        func.schedule_settings_warmup(guild.id for guild in self.guilds)
+
+    async def on_guild_available(self, guild: discord.Guild):
+        func.schedule_settings_warmup([guild.id])
 
     async def on_command_error(self, ctx: commands.Context, exception, /) -> None:
         error = getattr(exception, 'original', exception)
@@ -0,0 +1,14 @@
+import atexit
+import os
+import shutil
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SETTINGS_FILE = os.path.join(ROOT_DIR, "settings.json")
+
+sys.path.insert(0, ROOT_DIR)
+
+# function.py refuses to load without a settings file, the example settings are enough for the tests
+if not os.path.exists(SETTINGS_FILE):
+    shutil.copyfile(os.path.join(ROOT_DIR, "settings Example.json"), SETTINGS_FILE)
+    atexit.register(os.remove, SETTINGS_FILE)
@@ -0,0 +1,25 @@
+from voicelink.placeholders import compile_template
+
+VARIABLES = {"track_name": "Song", "track_author": "Artist", "volume": "100", "loop_mode": "Off"}
+
+def render(template: str) -> str:
+    return compile_template(template)(VARIABLES)
+
+def test_plain_variables():
+    assert render("@@track_name@@ by @@track_author@@") == "Song by Artist"
+
+def test_numeric_comparison():
+    assert render("{{@@volume@@ > 50 ?? loud // quiet}}") == "loud"
+    assert render("{{@@volume@@ == 100 and @@loop_mode@@ == 'Off' ?? yes // no}}") == "yes"
+
+def test_string_methods():
+    assert render("{{@@track_name@@.upper() == 'SONG' ?? yes // no}}") == "yes"
+    assert render("{{@@track_author@@.lower().startswith('art') ?? yes // no}}") == "yes"
+
+def test_string_method_on_number_renders_empty():
+    assert render("{{@@volume@@.upper() ?? yes // no}}") == ""
+
+def test_unsupported_expressions_render_empty():
+    assert render("{{@@track_name@@.__class__ ?? yes // no}}") == ""
+    assert render("{{().__class__.__bases__ ?? yes // no}}") == ""
+    assert render("{{__import__('os') ?? yes // no}}") == ""
@@ -0,0 +1,119 @@
+import random
+
+from voicelink.queue import BlockList, FairQueue, IndexedQueue, Queue
+
+class FakeTrack:
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.requester: str = name[0]
+        self.uri: str = f"https://example.com/{name}"
+
+    def __repr__(self) -> str:
+        return self.name
+
+def make_queue(size: int = 1000) -> FairQueue:
+    return FairQueue(size, True, lambda key: key)
+
+def names(tracks) -> list:
+    return [track.name for track in tracks]
+
+def test_put_interleaves_requesters():
+    queue = make_queue()
+    for name in ("a1", "a2", "a3", "b1", "b2", "c1"):
+        queue.put(FakeTrack(name))
+
+    assert names(queue.tracks()) == ["a1", "b1", "c1", "a2", "b2", "a3"]
+
+def test_put_returns_the_position():
+    queue = make_queue()
+    positions = [queue.put(FakeTrack(name)) for name in ("a1", "a2", "b1")]
+
+    assert positions == [0, 1, 1]
+
+def test_put_many_matches_repeated_put():
+    rnd = random.Random(0)
+    for _ in range(200):
+        existing = [FakeTrack(f"{rnd.choice('abcd')}{i}") for i in range(rnd.randint(0, 20))]
+        added = [FakeTrack(f"{rnd.choice('abcd')}{i}") for i in range(20, 20 + rnd.randint(0, 20))]
+        played = rnd.randint(0, len(existing))
+
+        one_by_one, batched = make_queue(), make_queue()
+        for queue in (one_by_one, batched):
+            for track in existing:
+                queue.put(track)
+            for _ in range(played):
+                queue.get()
+
+        for track in added:
+            one_by_one.put(track)
+        batched.put_many(added)
+
+        assert names(batched._queue) == names(one_by_one._queue)
+
+def test_playing_track_counts_as_its_requesters_turn():
+    # a0 is playing, so the next track of "a" waits until "c" had its second turn
+    queue = make_queue()
+    for name in ("a0", "c1", "c2"):
+        queue.put(FakeTrack(name))
+    queue.get()
+
+    queue.put(FakeTrack("a3"))
+    assert names(queue.tracks(incTrack=True)) == ["a0", "c1", "c2", "a3"]
+
+def test_history_is_left_untouched():
+    queue = make_queue()
+    for name in ("a1", "a2", "a3", "b1"):
+        queue.put(FakeTrack(name))
+    for _ in range(3):
+        queue.get()
+
+    # a1 and b1 are history, a2 is playing
+    assert names(queue.history()) == ["a1", "b1"]
+    queue.put_many([FakeTrack("b2"), FakeTrack("c1"), FakeTrack("a4")])
+
+    assert names(queue.history()) == ["a1", "b1"]
+    assert names(queue.tracks(incTrack=True)) == ["a2", "b2", "c1", "a3", "a4"]
+
+def test_put_many_with_index_skips_the_fair_order():
+    queue = make_queue()
+    for name in ("a1", "a2", "b1"):
+        queue.put(FakeTrack(name))
+
+    queue.put_many([FakeTrack("c1"), FakeTrack("c2")], at=0)
+    assert names(queue.tracks()) == ["c1", "c2", "a1", "b1", "a2"]
+
+def test_put_many_stops_at_the_size_limit():
+    queue = make_queue(size=3)
+    assert queue.put_many([FakeTrack(f"a{i}") for i in range(5)]) == 3
+    assert queue.count == 3
+
+def test_block_list_matches_list():
+    rnd = random.Random(1)
+    items = list(range(2000))
+    blocks = BlockList(items, key=lambda item: item % 7)
+    for _ in range(300):
+        start = rnd.randint(0, len(items))
+        stop = start + rnd.randint(0, 600)
+        if rnd.random() < 0.5:
+            del items[start:stop], blocks[start:stop]
+        else:
+            new = [rnd.randint(0, 10000) for _ in range(rnd.randint(0, 600))]
+            items[start:stop] = blocks[start:stop] = new
+
+        assert list(blocks) == items
+        assert list(blocks.find(3, 100, 900)) == [i for i in range(100, min(900, len(items))) if items[i] % 7 == 3]
+
+def test_indexed_queue_removes_tracks_of_a_member():
+    rnd = random.Random(2)
+    tracks = [FakeTrack(f"{rnd.choice('abc')}{i}") for i in range(1500)]
+    plain, indexed = Queue(5000, True, lambda key: key), IndexedQueue(5000, True, lambda key: key)
+    for queue in (plain, indexed):
+        queue.put_many(tracks)
+        queue.get()
+
+    for member in ("a", "c"):
+        assert names(indexed.remove(10, 1200, member).values()) == names(plain.remove(10, 1200, member).values())
+        assert names(indexed.tracks()) == names(plain.tracks())
+
+    assert indexed.requester_count("a") == sum(track.requester == "a" for track in indexed._queue)
+    assert indexed.remove(0, 10, "d") == {}
@@ -0,0 +1,84 @@
+import copy
+
+import pytest
+
+from function import apply_update
+
+@pytest.fixture
+def document():
+    return {
+        "history": ["a", "b", "c", "d", "e"],
+        "playlist": {"200": {"tracks": ["x", "y", "x"], "perms": {"read": [1, 2], "write": []}}},
+        "inbox": [{"sender": 1, "referId": "200"}, {"sender": 2}]
+    }
+
+def test_push_single_value(document):
+    assert apply_update(document, {"$push": {"history": "f"}})
+    assert document["history"] == ["a", "b", "c", "d", "e", "f"]
+
+def test_push_creates_missing_list(document):
+    assert apply_update(document, {"$push": {"playlist.201.tracks": "x"}})
+    assert document["playlist"]["201"] == {"tracks": ["x"]}
+
+def test_push_each(document):
+    assert apply_update(document, {"$push": {"history": {"$each": ["f", "g"]}}})
+    assert document["history"] == ["a", "b", "c", "d", "e", "f", "g"]
+
+@pytest.mark.parametrize("size, expected", [
+    (3, ["a", "b", "c"]),
+    (-3, ["e", "f", "g"]),
+    (0, []),
+    (10, ["a", "b", "c", "d", "e", "f", "g"])
+])
+def test_push_slice(document, size, expected):
+    assert apply_update(document, {"$push": {"history": {"$each": ["f", "g"], "$slice": size}}})
+    assert document["history"] == expected
+
+@pytest.mark.parametrize("position, expected", [
+    (0, ["f", "g", "a", "b", "c", "d", "e"]),
+    (2, ["a", "b", "f", "g", "c", "d", "e"]),
+    (-1, ["a", "b", "c", "d", "f", "g", "e"]),
+    (-10, ["f", "g", "a", "b", "c", "d", "e"]),
+    (10, ["a", "b", "c", "d", "e", "f", "g"])
+])
+def test_push_position(document, position, expected):
+    assert apply_update(document, {"$push": {"history": {"$each": ["f", "g"], "$position": position}}})
+    assert document["history"] == expected
+
+def test_push_position_with_slice(document):
+    assert apply_update(document, {"$push": {"history": {"$each": ["z"], "$position": 0, "$slice": 3}}})
+    assert document["history"] == ["z", "a", "b"]
+
+def test_pull_scalar(document):
+    assert apply_update(document, {"$pull": {"playlist.200.tracks": "x"}})
+    assert document["playlist"]["200"]["tracks"] == ["y"]
+
+def test_pull_in_scalars(document):
+    assert apply_update(document, {"$pull": {"playlist.200.perms.read": {"$in": [2, 3]}}})
+    assert document["playlist"]["200"]["perms"]["read"] == [1]
+
+def test_pull_in_documents(document):
+    assert apply_update(document, {"$pull": {"inbox": {"$in": [{"sender": 2}]}}})
+    assert document["inbox"] == [{"sender": 1, "referId": "200"}]
+
+def test_pull_matching_document(document):
+    assert apply_update(document, {"$pull": {"inbox": {"sender": 1}}})
+    assert document["inbox"] == [{"sender": 2}]
+
+def test_numeric_path_segments(document):
+    assert apply_update(document, {"$set": {"history.0": "q", "inbox.1.sender": 3}})
+    assert document["history"][0] == "q"
+    assert document["inbox"][1] == {"sender": 3}
+
+def test_set_inc_and_unset(document):
+    assert apply_update(document, {"$set": {"playlist.200.perms.write": [4]}, "$inc": {"count": 2}})
+    assert document["playlist"]["200"]["perms"]["write"] == [4]
+    assert document["count"] == 2
+
+    assert apply_update(document, {"$unset": {"playlist.200": ""}})
+    assert "200" not in document["playlist"]
+
+def test_unsupported_operator_leaves_document_untouched(document):
+    snapshot = copy.deepcopy(document)
+    assert not apply_update(document, {"$set": {"history": []}, "$addToSet": {"tags": 1}})
+    assert document == snapshot
@@ -26,7 +26,7 @@ import voicelink
 import function as func
 
 from discord.ext import commands
-from typing import Dict
+from typing import Dict, Optional
 
 from . import ButtonOnCooldown
 
@@ -44,6 +44,11 @@ class ControlButton(discord.ui.Button):
         
         self.disable_button_text: bool = func.settings.controller.get("disableButtonText", False)
         super().__init__(label=self.player.get_msg(label) if label and not self.disable_button_text else None, **kwargs)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Updates the button to match the current player state."""
+        pass
 
     async def send(self, interaction: discord.Interaction, key: str, *params, ephemeral: bool = False) -> None:
         stay = self.player.settings.get("controller_msg", True)
@@ -58,9 +63,11 @@ class Back(ControlButton):
         super().__init__(
             emoji="⏮️",
             label="buttonBack",
-            disabled=False if kwargs["player"].queue.history() or not kwargs["player"].current else True,
             **kwargs
         )
+
+    def refresh(self) -> None:
+        self.disabled = False if self.player.queue.history() or not self.player.current else True
     
     async def callback(self, interaction: discord.Interaction):
         if not self.player.is_privileged(interaction.user):
@@ -90,9 +97,14 @@ class Resume(ControlButton):
         super().__init__(
             emoji="⏸️",
             label="buttonPause",
-            disabled=kwargs["player"].current is None,
             **kwargs
         )
+
+    def refresh(self) -> None:
+        self.disabled = self.player.current is None
+        self.emoji = "▶️" if self.player.is_paused else "⏸️"
+        if not self.disable_button_text:
+            self.label = self.player.get_msg("buttonResume" if self.player.is_paused else "buttonPause")
     
     async def callback(self, interaction: discord.Interaction):
         is_paused = not self.player.is_paused
@@ -170,9 +182,11 @@ class Add(ControlButton):
     def __init__(self, **kwargs):
         super().__init__(
             emoji="❤️",
-            disabled=kwargs["player"].current is None,
             **kwargs
         )
+
+    def refresh(self) -> None:
+        self.disabled = self.player.current is None
     
     async def callback(self, interaction: discord.Interaction):
         track = self.player.current
@@ -180,7 +194,7 @@ class Add(ControlButton):
             return await self.send(interaction, "noTrackPlaying")
         if track.is_stream:
             return await self.send(interaction, "playlistAddError")
-        user = await func.get_user(interaction.user.id, 'playlist')
+        user = (await func.get_user_view(interaction.user.id))['playlist']
         rank, max_p, max_t = func.check_roles()
         if len(user['200']['tracks']) >= max_t:
             return await self.send(interaction, "playlistlimited", max_t, ephemeral=True)
@@ -202,10 +216,12 @@ class Loop(ControlButton):
         }
         
         super().__init__(
-            emoji=self.get_next_loop_emoji(kwargs["player"]),
             label="buttonLoop",
             **kwargs
         )
+
+    def refresh(self) -> None:
+        self.emoji = self.get_next_loop_emoji(self.player)
     
     def get_next_loop_emoji(self, player) -> str:
         current_repeat_mode = player.queue.repeat.lower()
@@ -261,10 +277,13 @@ class VolumeDown(ControlButton):
 class VolumeMute(ControlButton):
     def __init__(self, **kwargs):
         super().__init__(
-            emoji="🔇" if kwargs["player"].volume else "🔈",
-            label="buttonVolumeMute" if kwargs["player"].volume else "buttonVolumeUnmute",
             **kwargs
         )
+
+    def refresh(self) -> None:
+        self.emoji = "🔇" if self.player.volume else "🔈"
+        if not self.disable_button_text:
+            self.label = self.player.get_msg("buttonVolumeMute" if self.player.volume else "buttonVolumeUnmute")
     
     async def callback(self, interaction: discord.Interaction):
         if not self.player.is_privileged(interaction.user):
@@ -325,9 +344,11 @@ class Forward(ControlButton):
         super().__init__(
             emoji="⏩",
             label="buttonForward",
-            disabled=kwargs["player"].current is None,
             **kwargs
         )
+
+    def refresh(self) -> None:
+        self.disabled = self.player.current is None
         
     async def callback(self, interaction: discord.Interaction):
         if not self.player.is_privileged(interaction.user):
@@ -346,9 +367,11 @@ class Rewind(ControlButton):
         super().__init__(
             emoji="⏪",
             label="buttonRewind",
-            disabled=kwargs["player"].current is None,
             **kwargs
         )
+
+    def refresh(self) -> None:
+        self.disabled = self.player.current is None
         
     async def callback(self, interaction: discord.Interaction):
         if not self.player.is_privileged(interaction.user):
@@ -366,18 +389,22 @@ class Tracks(discord.ui.Select):
     def __init__(self, player, style, row):
 
         self.player: voicelink.Player = player
-        
+
+        super().__init__(
+            placeholder=self.player.get_msg("playerDropdown"),
+            row=row
+        )
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Lists the next ten tracks of the queue."""
         options = []
         for index, track in enumerate(self.player.queue.tracks(), start=1):
             if index > 10:
                 break
             options.append(discord.SelectOption(label=f"{index}. {track.title[:40]}", description=f"{track.author[:30]} · " + ("Live" if track.is_stream else track.formatted_length), emoji=track.emoji))
 
-        super().__init__(
-            placeholder=self.player.get_msg("playerDropdown"),
-            options=options,
-            row=row
-        )
+        self.options = options
 
     async def callback(self, interaction: discord.Interaction):
         if not self.player.is_privileged(interaction.user):
@@ -404,6 +431,9 @@ class Effects(discord.ui.Select):
             row=row
         )
 
+    def refresh(self) -> None:
+        pass
+
     async def callback(self, interaction: discord.Interaction):
         if not self.player.is_privileged(interaction.user):
             return await func.send(interaction, "missingPerms_function", ephemeral=True)
@@ -447,10 +477,14 @@ BUTTONCOLOR: Dict[str, discord.ButtonStyle] = {
 }
 
 class InteractiveController(discord.ui.View):
+    """The music controller of a player.
+       The view is created once per player and patched with `refresh` whenever the player state changes.
+    """
     def __init__(self, player):
         super().__init__(timeout=None)
 
         self.player: voicelink.Player = player
+        self.tracks: Optional[Tracks] = None
         for row, btnRow in enumerate(func.settings.controller.get("default_buttons")):
             for btn in btnRow:
                 color = ""
@@ -459,11 +493,36 @@ class InteractiveController(discord.ui.View):
                     btn = list(btn.keys())[0]
                 btnClass = BUTTONTYPE.get(btn.lower())
                 style = BUTTONCOLOR.get(color.lower(), BUTTONCOLOR["grey"])
-                if not btnClass or (self.player.queue.is_empty and btn == "tracks"):
+                if not btnClass:
+                    continue
+                if btnClass is Tracks:
+                    self.tracks = Tracks(player=player, style=style, row=row)
                     continue
                 self.add_item(btnClass(player=player, style=style, row=row))
 
+        self._update_tracks()
         self.cooldown = commands.CooldownMapping.from_cooldown(2.0, 10.0, key)
+
+    def _update_tracks(self) -> None:
+        """Shows the track dropdown only while the queue has tracks."""
+        if not self.tracks:
+            return
+
+        if self.player.queue.is_empty:
+            if self.tracks in self.children:
+                self.remove_item(self.tracks)
+        elif self.tracks not in self.children:
+            self.add_item(self.tracks)
+
+    def refresh(self) -> None:
+        """Patches every item with the current player state instead of building a new view."""
+        for item in self.children:
+            if item is not self.tracks:
+                item.refresh()
+
+        if self.tracks and not self.player.queue.is_empty:
+            self.tracks.refresh()
+        self._update_tracks()
             
     async def interaction_check(self, interaction: discord.Interaction):
         if not self.player.node._available:
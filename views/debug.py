@@ -292,12 +292,15 @@ class NodesPanel(discord.ui.View):
                 if node._available:
                     total_memory = node.stats.used + node.stats.free
                     embed.add_field(
-                        name=f"{name} Node - 🟢 Connected",
+                        name=f"{name} Node - " + ("🟡 Draining" if node.is_draining else "🟢 Connected"),
                         value=f"```• ADDRESS: {node._host}:{node._port}\n" \
                             f"• PLAYERS: {len(node._players)}\n" \
                             f"• CPU:     {node.stats.cpu_process_load:.1f}%\n" \
                             f"• RAM:     {func.format_bytes(node.stats.free)}/{func.format_bytes(total_memory, True)} ({(node.stats.free/total_memory) * 100:.1f}%)\n"
                             f"• LATENCY: {node.latency:.2f}ms\n" \
+                            f"• REST:    {node.request_stats.in_flight} active, p95 ≤{node.request_stats.percentile(95):.0f}ms ({node.request_stats.errors}/{node.request_stats.total} failed)\n" \
+                            f"• EVENTS:  {node.dispatch_stats['queued']} queued, {node.dispatch_stats['dropped']} dropped, {node.dispatch_stats['late']} late\n" \
+                            f"• RESTORE: {node.restore_stats['restored']}/{node.restore_stats['total']} ({node.restore_stats['duration']}s)\n" \
                             f"• UPTIME:  {func.time(node.stats.uptime)}```"
                     )
                 else:
@@ -352,6 +355,21 @@ class NodesPanel(discord.ui.View):
             await self.selected_node.disconnect()
             
             await self.message.edit(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="Drain", disabled=True, row=1)
+    async def drain(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer()
+        if self.selected_node.is_draining:
+            self.selected_node.undrain()
+
+            await self.message.edit(embed=self.build_embed(), view=self)
+            await interaction.followup.send(f"{self.selected_node._identifier} Node is no longer draining.", ephemeral=True)
+
+        elif self.selected_node.is_connected:
+            moved = await self.selected_node.drain()
+
+            await self.message.edit(embed=self.build_embed(), view=self)
+            await interaction.followup.send(f"Moved {moved} players off {self.selected_node._identifier} Node.", ephemeral=True)
         
 class CogsView(discord.ui.View):
     def __init__(self, bot, *, timeout: float | None = 180):
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import re
+import ast
+import operator
 import function as func
 
 from discord import Embed, Client
+from functools import lru_cache
 
-from typing import TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Mapping, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .player import Player
@@ -130,45 +133,175 @@ class Placeholders:
     def bot_icon(self) -> str:
         return self.bot.user.display_avatar.url if self.player else "https://i.imgur.com/dIFBwU7.png"
         
-    def replace(self, text: str, variables: dict[str, str]) -> str:
+    def replace(self, text: str, variables: Optional[Mapping[str, Any]] = None) -> str:
         if not text or text.isspace(): return
-        pattern = r"\{\{(.*?)\}\}"
-        matches: list[str] = re.findall(pattern, text)
-
-        for match in matches:
-            parts: list[str] = match.split("??")
-            expression = parts[0].strip()
-            true_value, false_value = "", ""
-
-            # Split the true and false values
-            if "//" in parts[1]:
-                true_value, false_value = [part.strip() for part in parts[1].split("//")]
-            else:
-                true_value = parts[1].strip()
-
-            try:
-                # Replace variable placeholders with their values
-                expression = re.sub(r'@@(.*?)@@', lambda x: "'" + variables.get(x.group(1), '') + "'", expression)
-                expression = re.sub(r"'(\d+)'", lambda x: str(int(x.group(1))), expression)
-                expression = re.sub(r"'(\d+)'\s*([><=!]+)\s*(\d+)", lambda x: f"{int(x.group(1))} {x.group(2)} {int(x.group(3))}", expression)
-
-                # Evaluate the expression
-                result = eval(expression, {"__builtins__": None}, variables)
-
-                # Replace the match with the true or false value based on the result
-                replacement = true_value if result else false_value
-                text = text.replace("{{" + match + "}}", replacement)
-
-            except:
-                text = text.replace("{{" + match + "}}", "")
-
-        text = re.sub(r'@@(.*?)@@', lambda x: str(variables.get(x.group(1), '')), text)
-        return text
-    
+        return compile_template(text)(LazyVariables(self) if variables is None else variables)
+
+class LazyVariables(dict):
+    """Resolves the placeholder variables on first access, so only the ones a template references are evaluated."""
+    def __init__(self, placeholder: Placeholders) -> None:
+        super().__init__()
+        self._variables: Dict[str, Any] = placeholder.variables
+
+    def __missing__(self, key: str) -> Any:
+        value = self._variables[key]
+        self[key] = value = value() if callable(value) else value
+        return value
+
+Renderer = Callable[[Mapping[str, Any]], Any]
+
+TEMPLATE_PATTERN = re.compile(r"\{\{(.*?)\}\}")
+VARIABLE_PATTERN = re.compile(r"@@(.*?)@@")
+NUMBER_PATTERN = re.compile(r"\d+")
+VARIABLE_PREFIX = "__variable__"
+
+OPERATORS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne,
+    ast.Lt: operator.lt, ast.LtE: operator.le,
+    ast.Gt: operator.gt, ast.GtE: operator.ge,
+    ast.Is: operator.is_, ast.IsNot: operator.is_not,
+    ast.In: lambda a, b: a in b, ast.NotIn: lambda a, b: a not in b,
+    ast.Add: operator.add, ast.Sub: operator.sub,
+    ast.Mult: operator.mul, ast.Div: operator.truediv, ast.Mod: operator.mod,
+    ast.Not: operator.not_, ast.USub: operator.neg
+}
+
+STRING_METHODS: frozenset = frozenset({
+    "capitalize", "casefold", "count", "endswith", "find", "isalnum", "isalpha", "isdigit",
+    "islower", "isnumeric", "isspace", "istitle", "isupper", "lower", "lstrip", "removeprefix",
+    "removesuffix", "replace", "rstrip", "startswith", "strip", "swapcase", "title", "upper"
+})
+
+def _get_variable(variables: Mapping[str, Any], name: str, default: Any = "") -> Any:
+    try:
+        return variables[name]
+    except KeyError:
+        return default
+
+def _to_number(value: str) -> Any:
+    return int(value) if NUMBER_PATTERN.fullmatch(value) else value
+
+def _compile_text(text: str) -> Renderer:
+    """Compiles plain text with @@variable@@ placeholders."""
+    parts: List[Any] = []
+    for index, part in enumerate(VARIABLE_PATTERN.split(text)):
+        if index % 2:
+            parts.append(lambda variables, name=part: str(_get_variable(variables, name)))
+        elif part:
+            parts.append(part)
+
+    if all(isinstance(part, str) for part in parts):
+        text = "".join(parts)
+        return lambda variables: text
+
+    return lambda variables: "".join(part if isinstance(part, str) else part(variables) for part in parts)
+
+def _compile_node(node: ast.AST) -> Renderer:
+    """Compiles a whitelisted expression node into a closure."""
+    if isinstance(node, ast.Constant):
+        value = _to_number(node.value) if isinstance(node.value, str) else node.value
+        return lambda variables: value
+
+    if isinstance(node, ast.Name):
+        if node.id.startswith(VARIABLE_PREFIX):
+            name = node.id[len(VARIABLE_PREFIX):]
+            return lambda variables: _to_number(str(_get_variable(variables, name)))
+        return lambda variables, name=node.id: variables[name]
+
+    if isinstance(node, ast.BoolOp):
+        values = [_compile_node(value) for value in node.values]
+        if isinstance(node.op, ast.And):
+            def _and(variables):
+                result = True
+                for value in values:
+                    if not (result := value(variables)):
+                        break
+                return result
+            return _and
+
+        def _or(variables):
+            result = False
+            for value in values:
+                if result := value(variables):
+                    break
+            return result
+        return _or
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in OPERATORS:
+        op, operand = OPERATORS[type(node.op)], _compile_node(node.operand)
+        return lambda variables: op(operand(variables))
+
+    if isinstance(node, ast.BinOp) and type(node.op) in OPERATORS:
+        op, left, right = OPERATORS[type(node.op)], _compile_node(node.left), _compile_node(node.right)
+        return lambda variables: op(left(variables), right(variables))
+
+    if (
+        isinstance(node, ast.Call) and not node.keywords
+        and isinstance(node.func, ast.Attribute) and node.func.attr in STRING_METHODS
+    ):
+        target, method = _compile_node(node.func.value), node.func.attr
+        args = [_compile_node(arg) for arg in node.args]
+
+        def _call(variables):
+            value = target(variables)
+            if not isinstance(value, str):
+                raise TypeError(f"{method}() is only supported on text")
+            return getattr(value, method)(*(arg(variables) for arg in args))
+        return _call
+
+    if isinstance(node, ast.Compare):
+        left = _compile_node(node.left)
+        comparisons = [(OPERATORS[type(op)], _compile_node(comparator)) for op, comparator in zip(node.ops, node.comparators)]
+
+        def _compare(variables):
+            value = left(variables)
+            for op, comparator in comparisons:
+                other = comparator(variables)
+                if not op(value, other):
+                    return False
+                value = other
+            return True
+        return _compare
+
+    raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+
+def _compile_condition(match: str) -> Renderer:
+    """Compiles a `{{expression ?? true // false}}` block."""
+    try:
+        parts: List[str] = match.split("??")
+        true_value, _, false_value = parts[1].partition("//")
+        true_value, false_value = _compile_text(true_value.strip()), _compile_text(false_value.strip())
+
+        expression = VARIABLE_PATTERN.sub(
+            lambda x: VARIABLE_PREFIX + x.group(1) if x.group(1).isidentifier() else "''",
+            parts[0].strip()
+        )
+        condition = _compile_node(ast.parse(expression, mode="eval").body)
+
+    except Exception as e:
+        func.logger.warning(f"Unsupported template expression {{{{{match}}}}} is rendered as empty text: {e}")
+        return lambda variables: ""
+
+    def _render(variables):
+        try:
+            return true_value(variables) if condition(variables) else false_value(variables)
+        except Exception:
+            return ""
+    return _render
+
+@lru_cache(maxsize=512)
+def compile_template(text: str) -> Renderer:
+    """Compiles a controller template into a renderer, the result is cached by the template text."""
+    parts: List[Renderer] = []
+    for index, part in enumerate(TEMPLATE_PATTERN.split(text)):
+        parts.append(_compile_condition(part) if index % 2 else _compile_text(part))
+
+    return lambda variables: "".join(part(variables) for part in parts)
+
 def build_embed(raw: dict[str, dict], placeholder: Placeholders) -> Embed:
     embed = Embed()
     try:
-        rv = {key: func() if callable(func) else func for key, func in placeholder.variables.items()}
+        rv = LazyVariables(placeholder)
         if author := raw.get("author"):
             embed.set_author(
                 name = placeholder.replace(author.get("name"), rv),
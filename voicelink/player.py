@@ -25,12 +25,14 @@ import time, logging
 import function as func
 
 from math import ceil
-from asyncio import sleep
+from asyncio import Event, Task, create_task, sleep
+from contextlib import asynccontextmanager
 from views import InteractiveController
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Union, Tuple
 
 from discord import (
     Client,
+    Embed,
     Guild,
     VoiceChannel,
     VoiceProtocol,
@@ -41,18 +43,23 @@ from discord import (
     errors
 )
 
+from discord.abc import Messageable
 from discord.ext import commands
 from . import events
-from .enums import SearchType, LoopType, RequestMethod
+from .enums import SearchType, LoopType, RequestMethod, NodeAlgorithm
 from .events import VoicelinkEvent, TrackEndEvent, TrackStartEvent
 from .exceptions import VoicelinkException, FilterInvalidArgument, TrackInvalidPosition, TrackLoadError, FilterTagAlreadyInUse, DuplicateTrack
 from .filters import Filter, Filters
 from .objects import Track, Playlist
 from .pool import Node, NodePool
-from .queue import Queue, FairQueue
+from .queue import Queue, FairQueue, IndexedQueue
 from .placeholders import Placeholders, build_embed
 from random import shuffle, choice
 
+CONTROLLER_DEBOUNCE = 1
+CONTROLLER_FRESH_LIMIT = 5
+VOICE_STATUS_DEBOUNCE = 2
+
 async def connect_channel(ctx: Union[commands.Context, Interaction], channel: VoiceChannel = None):
     texts = await func.get_lang(ctx.guild.id, "noChannel", "noPermission")
     try:
@@ -112,7 +119,7 @@ class Player(VoiceProtocol):
         self._volume: int = self.settings.get('volume', 100)
         self.queue: Queue = eval(self.settings.get("queueType", "Queue"))(self.settings.get("maxQueue", func.settings.max_queue), self.settings.get("duplicateTrack", True), self.get_msg)
 
-        self._node = NodePool.get_node()
+        self._node = NodePool.get_best_node(algorithm=NodeAlgorithm.BY_LOAD)
         self._current: Optional[Track] = None
         self._filters: Filters = Filters()
         self._paused: bool = False
@@ -126,9 +133,19 @@ class Player(VoiceProtocol):
         self._ending_track: Optional[Track] = None
 
         self._voice_state: dict = {}
+        self._pending_update: Optional[Dict[str, Any]] = None
+        self._pending_query: Optional[str] = None
 
         self.controller: Union[Message, PartialMessage] = None
-        self._updating: bool = False
+        self._controller_event: Event = Event()
+        self._controller_task: Optional[Task] = None
+        self._controller_view: Optional[InteractiveController] = None
+        self._controller_state: Optional[Tuple[Dict, List[Dict]]] = None
+        self._messages_after_controller: int = 0
+
+        self._voice_status: Optional[Tuple[int, Optional[str]]] = None
+        self._voice_status_event: Event = Event()
+        self._voice_status_task: Optional[Task] = None
 
         self.pause_votes = set()
         self.resume_votes = set()
@@ -283,9 +300,32 @@ class Player(VoiceProtocol):
         return build_embed(raw, self._ph)
 
     async def send(self, method: RequestMethod, query: str = None, data: Union[Dict, str] = {}) -> Dict:
-        """Sends an HTTP request to the node with the given method, query, and data."""
+        """Sends an HTTP request to the node with the given method, query, and data.
+           Inside `batch_update` the PATCH fields are merged and sent once the batch ends.
+        """
+        if method == RequestMethod.PATCH and self._pending_update is not None:
+            self._pending_update.update(data)
+            self._pending_query = query or self._pending_query
+            return {}
+
         uri: str = f"sessions/{self._node._session_id}/players/{self._guild.id}" + (f"?{query}" if query else "")
         return await self._node.send(method, query=uri, data=data)
+
+    @asynccontextmanager
+    async def batch_update(self) -> AsyncIterator[None]:
+        """Merges every player PATCH sent inside the block into a single request to the node."""
+        if self._pending_update is not None:
+            yield
+            return
+
+        self._pending_update, self._pending_query = {}, None
+        try:
+            yield
+        finally:
+            data, query = self._pending_update, self._pending_query
+            self._pending_update, self._pending_query = None, None
+            if data:
+                await self.send(method=RequestMethod.PATCH, query=query, data=data)
         
     async def _update_state(self, data: dict) -> None:
         """Updates the player's state based on the provided data."""
@@ -393,9 +433,7 @@ class Player(VoiceProtocol):
                 return await self.do_next()
 
             if not track.requester.bot:
-                self._bot.loop.create_task(func.update_user(track.requester.id, {
-                    "$push": {"history": {"$each": [track.track_id], "$slice": -25}}
-                }))
+                func.push_history(track.requester.id, track.track_id)
 
         if self.settings.get('controller', True):
             await self.invoke_controller()
@@ -411,14 +449,39 @@ class Player(VoiceProtocol):
             })
 
     async def invoke_controller(self):
-        """Sends or updates the music controller message in the designated channel."""
-        if self._updating or not self.channel:
+        """Schedules an update of the music controller message.
+           Calls made within `CONTROLLER_DEBOUNCE` seconds are merged into a single update.
+        """
+        if not self.channel:
             return
-        
-        self._updating = True
 
+        self._controller_event.set()
+        if not self._controller_task or self._controller_task.done():
+            self._controller_task = create_task(self._controller_updater())
+
+    async def _controller_updater(self):
+        """Runs the pending controller updates until no more are requested."""
+        while self._controller_event.is_set():
+            await sleep(CONTROLLER_DEBOUNCE)
+            self._controller_event.clear()
+            if self.channel and self.settings.get('controller', True):
+                await self._update_controller()
+
+    async def _send_controller(self, channel: Messageable, embed: Embed, view: InteractiveController) -> None:
+        """Sends a new controller message and resets its position tracking."""
+        self.controller = await channel.send(embed=embed, view=view)
+        self._messages_after_controller = 0
+
+    async def _update_controller(self):
+        """Sends or updates the music controller message in the designated channel."""
         try:            
-            embed, view = self.build_embed(self.current), InteractiveController(self)
+            if self._controller_view:
+                self._controller_view.refresh()
+            else:
+                self._controller_view = InteractiveController(self)
+
+            embed, view = self.build_embed(self.current), self._controller_view
+            state = (embed.to_dict(), view.to_components())
             if not self.controller:
                 if request_channel_data := self.settings.get("music_request_channel"):
                     channel = self.bot.get_channel(request_channel_data.get("text_channel_id"))
@@ -431,36 +494,42 @@ class Player(VoiceProtocol):
                 
                 # Send a new controller message if none exists
                 if not self.controller:
-                    self.controller = await self.context.channel.send(embed=embed, view=view)
+                    await self._send_controller(self.context.channel, embed, view)
 
-            elif not await self.is_position_fresh():
+            elif not self.is_position_fresh():
                 try:
                     await self.controller.delete()
                 except Exception as e:
                     self._logger.warning(
                         f"Failed to delete outdated controller in {self.guild.name}({self.guild.id}): {e}"
                     )
-                self.controller = await self.context.channel.send(embed=embed, view=view)
+                await self._send_controller(self.context.channel, embed, view)
 
-            else:
-                await self.controller.edit(embed=embed, view=view)
+            elif state != self._controller_state:
+                try:
+                    await self.controller.edit(embed=embed, view=view)
+                except errors.NotFound:
+                    # The message was deleted, e.g. by a moderator
+                    self.controller = None
+                    await self._send_controller(self.context.channel, embed, view)
+
+            self._controller_state = state
 
         except Exception as e:
+            self._controller_state = None
             self._logger.error(f"Something went wrong while sending music controller to {self.guild.name}({self.guild.id})", exc_info=e)
-        
-        finally:
-            self._updating = False
 
-    async def is_position_fresh(self):
+    def track_message(self, message: Message) -> None:
+        """Counts the messages sent after the controller, so its position is known without fetching the channel history."""
+        if self.controller and message.channel.id == self.controller.channel.id and message.id > self.controller.id:
+            self._messages_after_controller += 1
+
+    def is_position_fresh(self) -> bool:
         """Checks if the current controller message is among the most recent messages."""
-        try:
-            async for message in self.context.channel.history(limit=5):
-                if message.id == self.controller.id:
-                    return True
-        except:
-            pass
+        if self.controller.id == self.settings.get("music_request_channel", {}).get("controller_msg_id"):
+            return True
 
-        return False
+        return self._messages_after_controller < CONTROLLER_FRESH_LIMIT
     
     async def teardown(self):
         """Cleans up the player and associated resources."""
@@ -475,6 +544,11 @@ class Player(VoiceProtocol):
         except:
             pass
 
+        if self._controller_task:
+            self._controller_task.cancel()
+        if self._controller_view:
+            self._controller_view.stop()
+
         try:
             await self.update_voice_status(remove_status=True)
             if self.controller and self.controller.id == self.settings.get("music_request_channel", {}).get("controller_msg_id"):
@@ -488,6 +562,8 @@ class Player(VoiceProtocol):
             await self.destroy()
         except:
             pass
+        finally:
+            func.SETTINGS_BUFFER.unpin(self.guild.id)
 
     async def get_tracks(
         self,
@@ -512,6 +588,8 @@ class Player(VoiceProtocol):
         await self.guild.change_voice_state(channel=self.channel, self_deaf=True, self_mute=self_mute)
         self._node._players[self.guild.id] = self
         self._is_connected = True
+        # Keep the settings cached while the player is using them
+        func.SETTINGS_BUFFER.pin(self.guild.id)
 
         if self.channel:
             self._logger.debug(f"Player in {self.guild.name}({self.guild.id}) has been connected to {self.channel.name}({self.channel.id}).")
@@ -529,6 +607,7 @@ class Player(VoiceProtocol):
             self.cleanup()
             self._is_connected = False
             self.channel = None
+            func.SETTINGS_BUFFER.unpin(self.guild.id)
         
         self._logger.debug(f"Player in {self.guild.name}({self.guild.id}) has been disconnected from a voice channel.")
 
@@ -543,6 +622,7 @@ class Player(VoiceProtocol):
             assert self.channel is None and not self.is_connected
         
         self._node._players.pop(self.guild.id)
+        func.SETTINGS_BUFFER.unpin(self.guild.id)
         await self.send(method=RequestMethod.DELETE)
     
     async def play(
@@ -572,12 +652,13 @@ class Player(VoiceProtocol):
         if end or track.end_time:
             data["endTime"] = str(end if end else track.end_time)
 
-        await self.send(method=RequestMethod.PATCH, query=f"noReplace={ignore_if_playing}", data=data)
+        async with self.batch_update():
+            await self.send(method=RequestMethod.PATCH, query=f"noReplace={ignore_if_playing}", data=data)
 
-        self._current = track
+            if self.volume != 100:
+                await self.set_volume(self.volume)
 
-        if self.volume != 100:
-            await self.set_volume(self.volume)
+        self._current = track
 
         self._logger.debug(f"Player in {self.guild.name}({self.guild.id}) playing {track.title} from uri {track.uri} with a length of {track.length}")
         return self._current
@@ -603,21 +684,25 @@ class Player(VoiceProtocol):
     async def add_track(self, raw_tracks: Union[Track, List[Track]], *, start_time: int = 0, end_time: int = 0, at_front: bool = False, duplicate: bool = True) -> int:
         """Adds one or more tracks to the queue."""
         tracks: List[Track] = []
-        _duplicate_tracks = [] if self.queue._allow_duplicate and duplicate else [track.uri for track in self.queue._queue]
+        check_duplicate = not (self.queue._allow_duplicate and duplicate)
         raw_tracks = raw_tracks[0] if isinstance(raw_tracks, List) and len(raw_tracks) == 1 else raw_tracks
 
         try:
             if (is_list := isinstance(raw_tracks, List)):
+                pending: List[Track] = []
+                pending_uris: Set[str] = set()
                 for track in raw_tracks:
-                    if track.uri in _duplicate_tracks:
+                    if check_duplicate and (track.uri in pending_uris or self.queue.has_uri(track.uri)):
                         continue
 
                     self._validate_time(track, start_time, end_time)
-                    self.queue.put_at_front(track) if at_front else self.queue.put(track)  
-                    tracks.append(track)
-                    _duplicate_tracks.append(track.uri)
+                    pending.append(track)
+                    pending_uris.add(track.uri)
+
+                added = self.queue.put_many(pending, at=0 if at_front else None)
+                tracks.extend(pending[:added])
             else:
-                if raw_tracks.uri in _duplicate_tracks:
+                if check_duplicate and self.queue.has_uri(raw_tracks.uri):
                     raise DuplicateTrack(self.get_msg("voicelinkDuplicateTrack"))
                 
                 self._validate_time(raw_tracks, start_time, end_time)
@@ -742,9 +827,10 @@ class Player(VoiceProtocol):
             raise FilterTagAlreadyInUse(self.get_msg("FilterTagAlreadyInUse"))
         
         payload = self._filters.get_all_payloads()
-        await self.send(method=RequestMethod.PATCH, data={"filters": payload})
-        if fast_apply:
-            await self.seek(self.position)
+        async with self.batch_update():
+            await self.send(method=RequestMethod.PATCH, data={"filters": payload})
+            if fast_apply:
+                await self.seek(self.position)
         
         if self.is_ipc_connected:
             await self.send_ws({
@@ -773,9 +859,10 @@ class Player(VoiceProtocol):
     async def remove_filter(self, filter_tag: str, requester: Member = None, fast_apply: bool = False) -> Filters:
         self._filters.remove_filter(filter_tag=filter_tag)
         payload = self._filters.get_all_payloads()
-        await self.send(method=RequestMethod.PATCH, data={"filters": payload})
-        if fast_apply:
-            await self.seek(self.position)
+        async with self.batch_update():
+            await self.send(method=RequestMethod.PATCH, data={"filters": payload})
+            if fast_apply:
+                await self.seek(self.position)
         
         if self.is_ipc_connected:
             await self.send_ws({
@@ -793,9 +880,10 @@ class Player(VoiceProtocol):
             raise FilterInvalidArgument("You must have filters applied first in order to use this method.")
         
         self._filters.reset_filters()
-        await self.send(method=RequestMethod.PATCH, data={"filters": {}})
-        if fast_apply:
-            await self.seek(self.position)
+        async with self.batch_update():
+            await self.send(method=RequestMethod.PATCH, data={"filters": {}})
+            if fast_apply:
+                await self.seek(self.position)
 
         if self.is_ipc_connected:
             await self.send_ws({
@@ -812,18 +900,30 @@ class Player(VoiceProtocol):
         except:
             return await self.teardown()
 
+        old_node, old_session = self._node, self._node._session_id
         self._node._players.pop(self.guild.id)
         self._node = node
         self._node._players[self.guild.id] = self
 
-        await self._dispatch_voice_update(self._voice_state)
+        async with self.batch_update():
+            await self._dispatch_voice_update(self._voice_state)
+
+            if self._filters.get_filters():
+                await self.send(method=RequestMethod.PATCH, data={"filters": self._filters.get_all_payloads()})
 
-        if self.current:
-            await self.play(self.current, start=self.position)
-            self._last_update = time.time() * 1000
+            if self.current:
+                await self.play(self.current, start=self.position)
+                self._last_update = time.time() * 1000
 
-            if self.is_paused:
-                await self.set_pause(True)
+                if self.is_paused:
+                    await self.set_pause(True)
+
+        # Stop the player on the old node now that the new node has taken it over
+        if old_node is not node and old_session:
+            try:
+                await old_node.send(RequestMethod.DELETE, query=f"sessions/{old_session}/players/{self.guild.id}")
+            except Exception:
+                pass
     
     async def get_recommendations(self, *, track: Optional[Track] = None) -> bool:
         """Get recommendations from Youtube or Spotify."""
@@ -842,16 +942,40 @@ class Player(VoiceProtocol):
         return False
     
     async def update_voice_status(self, remove_status: bool = False) -> None:
-        """Updates the voice status of the channel based on the specified template."""
+        """Updates the voice status of the channel based on the specified template.
+           Updates within `VOICE_STATUS_DEBOUNCE` seconds are merged, so only the latest status is sent.
+        """
         template = self.settings.get("stage_announce_template", func.settings.voice_status_template)
         if not template or not self.channel:
             return
         
+        if remove_status:
+            if self._voice_status_task:
+                self._voice_status_task.cancel()
+            return await self._apply_voice_status(None)
+
+        self._voice_status_event.set()
+        if not self._voice_status_task or self._voice_status_task.done():
+            self._voice_status_task = create_task(self._voice_status_updater())
+
+    async def _voice_status_updater(self) -> None:
+        """Applies the latest voice status until no more updates are requested."""
+        while self._voice_status_event.is_set():
+            await sleep(VOICE_STATUS_DEBOUNCE)
+            self._voice_status_event.clear()
+
+            template = self.settings.get("stage_announce_template", func.settings.voice_status_template)
+            if template and self.channel:
+                await self._apply_voice_status(self._ph.replace(template))
+
+    async def _apply_voice_status(self, status: Optional[str]) -> None:
+        """Edits the channel status unless it is already the last applied one."""
+        if self._voice_status == (self.channel.id, status):
+            return
+
         try:
-            rv = {key: func() if callable(func) else func for key, func in self._ph.variables.items()}
-            status = None if remove_status else self._ph.replace(text=template, variables=rv)
-            # if self.channel.status != status:
             await self.channel.edit(status=status)
+            self._voice_status = (self.channel.id, status)
 
         except Exception as e:
             self._logger.error(
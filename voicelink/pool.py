@@ -24,14 +24,22 @@ SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-import os
+import json
 import re
+import time
 import aiohttp
 import logging
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+from contextlib import asynccontextmanager
 from discord import Client, Member
 from discord.ext.commands import Bot
-from typing import Dict, Optional, TYPE_CHECKING, Union, List
+from addons import LRUCache
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Optional, TYPE_CHECKING, Union, List
 from urllib.parse import quote
 
 from . import (
@@ -50,7 +58,7 @@ from .exceptions import (
     TrackLoadError
 )
 from .objects import Playlist, Track
-from .utils import ExponentialBackoff, NodeStats, NodeInfo, Ping
+from .utils import ExponentialBackoff, NodeStats, NodeInfo, Ping, RequestStats
 from .enums import RequestMethod
 
 if TYPE_CHECKING:
@@ -71,6 +79,22 @@ URL_REGEX = re.compile(
 
 NODE_VERSION = "v4"
 
+LATENCY_PROBE_INTERVAL = 30
+LATENCY_SMOOTHING = 0.3
+
+RESTORE_DELAY = 10
+READY_TIMEOUT = 10
+
+DRAIN_BATCH_SIZE = 5
+DRAIN_BATCH_DELAY = 1
+OVERLOAD_CPU_LOAD = 0.9
+OVERLOAD_FRAME_DEFICIT = 300
+OVERLOAD_STREAK = 3
+
+DISPATCH_WORKERS = 8
+DISPATCH_QUEUE_SIZE = 1000
+DISPATCH_LATE_THRESHOLD = 1
+
 class Node:
     """The base class for a node. 
        This node object represents a Lavalink node. 
@@ -91,7 +115,13 @@ class Node:
         session: Optional[aiohttp.ClientSession] = None,
         spotify_client_id: Optional[str] = None,
         spotify_client_secret: Optional[str] = None,
-        resume_key: Optional[str] = None,
+        resume_timeout: int = 60,
+        restore_concurrency: int = 10,
+        auto_rebalance: bool = False,
+        connection_limit: int = 100,
+        keepalive_timeout: float = 30,
+        dns_cache_ttl: int = 300,
+        request_timeout: float = 30,
         logger: Optional[logging.Logger] = None
     ):
         self._bot: Bot = bot
@@ -107,23 +137,48 @@ class Node:
         self._websocket_uri: str = f"{'wss' if self._secure else 'ws'}://{self._host}:{self._port}/" + NODE_VERSION + "/websocket"
         self._rest_uri: str = f"{'https' if self._secure else 'http'}://{self._host}:{self._port}"
 
-        self._session: aiohttp.ClientSession = session or aiohttp.ClientSession()
+        self._owns_session: bool = session is None
+        self._session: aiohttp.ClientSession = session or aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=connection_limit,
+                keepalive_timeout=keepalive_timeout,
+                ttl_dns_cache=dns_cache_ttl
+            )
+        )
+        self._request_timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(total=request_timeout)
+        self._request_stats: RequestStats = RequestStats()
         self._websocket: aiohttp.ClientWebSocketResponse = None
         self._task: asyncio.Task = None
+        self._ping_task: asyncio.Task = None
+        self._latency: Optional[float] = None
 
-        self.resume_key: str = resume_key or str(os.urandom(8).hex())
+        self._resume_timeout: int = resume_timeout
         self._session_id: str = None
+        self._resumed: bool = False
+        self._ready: asyncio.Event = asyncio.Event()
         self._available: bool = None
 
         self._headers: Dict[str, str] = {
             "Authorization": self._password,
             "User-Id": str(bot.user.id),
-            "Client-Name": f"Voicelink/{__version__}",
-            'Resume-Key': self.resume_key
+            "Client-Name": f"Voicelink/{__version__}"
         }
 
         self._players: Dict[int, Player] = {}
         self._info: Optional[NodeInfo] = None
+        self._stats: Optional[NodeStats] = None
+
+        self._restore_concurrency: int = max(1, restore_concurrency)
+        self._restore_stats: Dict[str, Union[int, float]] = {"total": 0, "restored": 0, "failed": 0, "duration": 0.0}
+
+        self._draining: bool = False
+        self._auto_rebalance: bool = auto_rebalance
+        self._overload_streak: int = 0
+        self._rebalance_task: Optional[asyncio.Task] = None
+
+        self._dispatch_queues: List[asyncio.Queue] = [asyncio.Queue(maxsize=DISPATCH_QUEUE_SIZE) for _ in range(DISPATCH_WORKERS)]
+        self._dispatch_tasks: List[asyncio.Task] = []
+        self._dispatch_stats: Dict[str, int] = {"processed": 0, "dropped": 0, "late": 0}
         
         self._spotify_client_id: Optional[str] = spotify_client_id
         self._spotify_client_secret: Optional[str] = spotify_client_secret
@@ -156,11 +211,36 @@ class Node:
         return self._websocket is not None and not self._websocket.closed
 
 
+    @property
+    def request_stats(self) -> RequestStats:
+        """Property which returns the latency histogram and in-flight count of the REST requests"""
+        return self._request_stats
+
+    @property
+    def dispatch_stats(self) -> Dict[str, int]:
+        """Property which returns the queued, processed, dropped and late websocket payload counts"""
+        return {**self._dispatch_stats, "queued": sum(queue.qsize() for queue in self._dispatch_queues)}
+
+    @property
+    def is_draining(self) -> bool:
+        """Property which returns whether the node is moving its players to other nodes"""
+        return self._draining
+
     @property
     def stats(self) -> NodeStats:
         """Property which returns the node stats."""
         return self._stats
 
+    @property
+    def penalty(self) -> float:
+        """Property which returns the load score of the node based on the latest stats.
+           Players created since the last stats update are added on top, so bursts spread across nodes.
+        """
+        if not self._stats:
+            return len(self._players)
+
+        return self._stats.penalty + max(0, len(self._players) - (self._stats.players_total or 0))
+
     @property
     def players(self) -> Dict[int, Player]:
         """Property which returns a dict containing the guild ID and the player object."""
@@ -183,8 +263,25 @@ class Node:
 
     @property
     def latency(self) -> float:
-        """Property which returns the latency of the node"""
-        return Ping(self._host, port=self._port).get_ping()
+        """Property which returns the smoothed latency of the node in milliseconds.
+           The value is refreshed in the background, so reading it never blocks.
+        """
+        return self._latency or 0.0
+
+    async def _probe_latency(self) -> None:
+        """Periodically measures the round trip time to the node and keeps a moving average of it."""
+        ping = Ping(self._host, port=self._port)
+        while True:
+            try:
+                rtt = await ping.get_ping_async()
+                if self._latency is None:
+                    self._latency = rtt
+                else:
+                    self._latency = LATENCY_SMOOTHING * rtt + (1 - LATENCY_SMOOTHING) * self._latency
+            except (OSError, asyncio.TimeoutError) as e:
+                self._logger.debug(f"Failed to measure the latency of node [{self._identifier}]: {e}")
+
+            await asyncio.sleep(LATENCY_PROBE_INTERVAL)
 
     async def _update_handler(self, data: dict) -> None:
         await self._bot.wait_until_ready()
@@ -230,8 +327,43 @@ class Node:
                         await self.connect()
                     except:
                         pass
-            else:
-                self._bot.loop.create_task(self._handle_payload(msg.json()))
+            elif msg.type == aiohttp.WSMsgType.TEXT:
+                await self._enqueue_payload(json_loads(msg.data))
+
+    async def _enqueue_payload(self, data: dict) -> None:
+        """Routes a payload to the dispatch queue of its guild, so payloads of a guild are handled in order.
+           Node wide payloads are handled right away. When a queue is full, player updates are dropped
+           since the next update supersedes them, while events wait for a free slot.
+        """
+        if "guildId" not in data:
+            try:
+                await self._handle_payload(data)
+            except Exception as e:
+                self._logger.error(f"Failed to handle a payload from node [{self._identifier}]", exc_info=e)
+            return
+
+        queue = self._dispatch_queues[int(data["guildId"]) % len(self._dispatch_queues)]
+        item = (time.monotonic(), data)
+        if data.get("op") == "playerUpdate":
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self._dispatch_stats["dropped"] += 1
+        else:
+            await queue.put(item)
+
+    async def _dispatch_worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            received, data = await queue.get()
+            if time.monotonic() - received > DISPATCH_LATE_THRESHOLD:
+                self._dispatch_stats["late"] += 1
+
+            try:
+                await self._handle_payload(data)
+            except Exception as e:
+                self._logger.error(f"Failed to handle a payload from node [{self._identifier}]", exc_info=e)
+
+            self._dispatch_stats["processed"] += 1
 
     async def _handle_payload(self, data: dict) -> None:
         op = data.get("op", None)
@@ -240,9 +372,12 @@ class Node:
 
         if op == "ready":
             self._session_id = data.get("sessionId")
+            self._resumed = data.get("resumed", False)
+            self._ready.set()
 
         if op == "stats":
             self._stats = NodeStats(data)
+            self._check_overload()
             return
 
         if "guildId" in data:
@@ -254,17 +389,27 @@ class Node:
         elif op == "playerUpdate":
             await player._update_state(data)
 
+    @asynccontextmanager
+    async def _request(self, method: str, url: str, **kwargs) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Sends a REST request to the node and records it in the request stats."""
+        self._request_stats.in_flight += 1
+        start, failed = time.perf_counter(), True
+        try:
+            async with self._session.request(
+                method, url, headers={"Authorization": self._password}, timeout=self._request_timeout, **kwargs
+            ) as resp:
+                yield resp
+                failed = resp.status >= 300
+        finally:
+            self._request_stats.in_flight -= 1
+            self._request_stats.observe((time.perf_counter() - start) * 1000, failed=failed)
+
     async def send(self, method: RequestMethod, query: str, data: Union[dict, str] = {}) -> dict:
         if not self._available:
             raise NodeNotAvailable(f"The node '{self._identifier}' is unavailable.")
         
         uri: str = f"{self._rest_uri}/{NODE_VERSION}/{query}"
-        async with self._session.request(
-            method=method.value,
-            url=uri,
-            headers={"Authorization": self._password},
-            json=data
-        ) as resp:
+        async with self._request(method.value, uri, json=data) as resp:
             if resp.status >= 300:
                 raise NodeException(f"Getting errors from Lavalink REST api")
             
@@ -276,12 +421,22 @@ class Node:
     async def connect(self) -> Node:
         """Initiates a connection with a Lavalink node and adds it to the node pool."""
 
+        headers = self._headers
+        if self._session_id:
+            headers = {**headers, "Session-Id": self._session_id}
+
+        self._ready.clear()
+        self._resumed = False
         try:
             self._websocket = await self._session.ws_connect(
-                self._websocket_uri, headers=self._headers, heartbeat=self._heartbeat
+                self._websocket_uri, headers=headers, heartbeat=self._heartbeat
             )
 
             self._task = self._bot.loop.create_task(self._listen())
+            if not self._ping_task or self._ping_task.done():
+                self._ping_task = self._bot.loop.create_task(self._probe_latency())
+            if not self._dispatch_tasks:
+                self._dispatch_tasks = [self._bot.loop.create_task(self._dispatch_worker(queue)) for queue in self._dispatch_queues]
             self._available = True
             self._info = NodeInfo(await self.send(RequestMethod.GET, query="info"))
             
@@ -300,10 +455,31 @@ class Node:
                 f"The URI for node '{self._identifier}' is invalid."
             )
         
-        if self.players:
-            await self.reconnect()
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=READY_TIMEOUT)
+            await self.configure_resuming()
+        except asyncio.TimeoutError:
+            self._logger.warning(f"Node [{self._identifier}] did not send a ready payload within {READY_TIMEOUT}s.")
+        except NodeException as e:
+            self._logger.warning(f"Node [{self._identifier}] was not able to configure session resuming: {e}")
+
+        if self._resumed:
+            self._logger.info(f"Node [{self._identifier}] resumed session {self._session_id} with {self.player_count} players.")
+
+        elif self.players:
+            self._bot.loop.create_task(self.reconnect())
 
         return self
+
+    async def configure_resuming(self) -> None:
+        """Enables session resuming for the current session, so Lavalink keeps
+           the players alive for `resume_timeout` seconds after the websocket drops.
+        """
+        await self.send(
+            RequestMethod.PATCH,
+            query=f"sessions/{self._session_id}",
+            data={"resuming": True, "timeout": self._resume_timeout}
+        )
               
     async def disconnect(self, remove_from_pool: bool = False) -> None:
         """Disconnects a connected Lavalink node and removes it from the node pool.
@@ -313,28 +489,156 @@ class Node:
             await player.teardown()
         
         await self._websocket.close()
+        self._session_id = None
+        self._resumed = False
+        self._draining = False
         if remove_from_pool:
             del self._pool._nodes[self._identifier]
+            if self._owns_session:
+                await self._session.close()
         self._available = False
         self._task.cancel()
+        if self._ping_task:
+            self._ping_task.cancel()
+        for task in self._dispatch_tasks:
+            task.cancel()
+        self._dispatch_tasks.clear()
         
         self._logger.info(f"Node [{self._identifier}] is disconnected!")
 
-    async def reconnect(self) -> None:
-        await asyncio.sleep(10)
-        for player in self.players.copy().values():
+    @property
+    def restore_stats(self) -> Dict[str, Union[int, float]]:
+        """Property which returns the progress of the latest player restoration."""
+        return self._restore_stats
+
+    async def _restore_player(self, player: Player, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
             try:
-                if player._voice_state:
-                    await player._dispatch_voice_update(player._voice_state)
+                async with player.batch_update():
+                    if player._voice_state:
+                        await player._dispatch_voice_update(player._voice_state)
 
-                if player.current:
-                    await player.play(track=player.current, start=min(player._last_position, player.current.length))
+                    if player.current:
+                        await player.play(track=player.current, start=min(player._last_position, player.current.length))
 
-                    if player.is_paused:
-                        await player.set_pause(True)
-            except:
+                        if player.is_paused:
+                            await player.set_pause(True)
+
+                self._restore_stats["restored"] += 1
+            except Exception as e:
+                self._restore_stats["failed"] += 1
+                self._logger.debug(f"Failed to restore player in {player.guild.name}({player.guild.id}) on node [{self._identifier}]: {e}")
                 await player.teardown()
-            await asyncio.sleep(2)
+
+    async def reconnect(self) -> None:
+        """Restores every player of the node after the connection was re-established.
+           Players that are actively playing to listeners are restored first,
+           and at most `restore_concurrency` players are restored at the same time.
+        """
+        await asyncio.sleep(RESTORE_DELAY)
+
+        def priority(player: Player) -> tuple[bool, bool]:
+            has_listeners = bool(player.channel) and any(not member.bot for member in player.channel.members)
+            return (not player.is_playing or player.is_paused, not has_listeners)
+
+        players = sorted(self.players.copy().values(), key=priority)
+        self._restore_stats = {"total": len(players), "restored": 0, "failed": 0, "duration": 0.0}
+
+        start = time.monotonic()
+        semaphore = asyncio.Semaphore(self._restore_concurrency)
+        await asyncio.gather(*(self._restore_player(player, semaphore) for player in players))
+        self._restore_stats["duration"] = round(time.monotonic() - start, 2)
+
+        self._logger.info(
+            f"Node [{self._identifier}] restored {self._restore_stats['restored']}/{len(players)} players "
+            f"in {self._restore_stats['duration']}s ({self._restore_stats['failed']} failed)"
+        )
+
+    def _check_overload(self) -> None:
+        """Moves a batch of players to other nodes once the stats report a sustained overload."""
+        overloaded = (
+            (self._stats.cpu_system_load or 0) >= OVERLOAD_CPU_LOAD
+            or self._stats.frames_deficit >= OVERLOAD_FRAME_DEFICIT
+        )
+        self._overload_streak = self._overload_streak + 1 if overloaded else 0
+
+        if not self._auto_rebalance or self._draining or self._overload_streak < OVERLOAD_STREAK:
+            return
+
+        if self._rebalance_task and not self._rebalance_task.done():
+            return
+
+        self._overload_streak = 0
+        self._rebalance_task = self._bot.loop.create_task(self.rebalance())
+
+    def _other_nodes(self) -> List[Node]:
+        return [
+            node for node in self._pool._nodes.values()
+            if node is not self and node._available and not node._draining
+        ]
+
+    async def _migrate_players(self, players: List[Player]) -> int:
+        """Moves the given players to other nodes in batches, keeping their track, position, filters and volume."""
+        moved = 0
+        for index in range(0, len(players), DRAIN_BATCH_SIZE):
+            # The node is marked as draining, so it is never picked as the target
+            try:
+                target = self._pool.get_best_node(algorithm=NodeAlgorithm.BY_LOAD)
+            except NoNodesAvailable:
+                self._logger.warning(f"No node is available to take the players of node [{self._identifier}].")
+                break
+
+            batch = [player for player in players[index:index + DRAIN_BATCH_SIZE] if player.node is self]
+            results = await asyncio.gather(*(player.change_node(target._identifier) for player in batch), return_exceptions=True)
+
+            for player, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    self._logger.error(f"Failed to move player in {player.guild.name}({player.guild.id}) off node [{self._identifier}]", exc_info=result)
+                elif player.node is not self:
+                    moved += 1
+
+            await asyncio.sleep(DRAIN_BATCH_DELAY)
+
+        return moved
+
+    async def drain(self) -> int:
+        """Puts the node into drain mode and moves all of its players to other nodes.
+           A draining node is not picked for new players until `undrain` is called or it is disconnected.
+           Returns the number of players that were moved.
+        """
+        if not self._other_nodes():
+            raise NoNodesAvailable("There are no other nodes available to move the players to.")
+
+        self._draining = True
+        self._logger.info(f"Node [{self._identifier}] is draining {self.player_count} players.")
+
+        moved = await self._migrate_players(list(self.players.values()))
+        self._logger.info(f"Node [{self._identifier}] moved {moved} players to other nodes.")
+        return moved
+
+    def undrain(self) -> None:
+        """Takes the node out of drain mode, so it is picked for new players again."""
+        if self._draining:
+            self._draining = False
+            self._logger.info(f"Node [{self._identifier}] is back in rotation.")
+
+    async def rebalance(self) -> int:
+        """Moves one batch of playing players to a less loaded node.
+           Returns the number of players that were moved.
+        """
+        if not (nodes := self._other_nodes()) or min(node.penalty for node in nodes) >= self.penalty:
+            return 0
+
+        players = [player for player in self.players.values() if player.is_playing and not player.is_paused]
+
+        self._draining = True
+        try:
+            moved = await self._migrate_players(players[:DRAIN_BATCH_SIZE])
+        finally:
+            self._draining = False
+
+        self._logger.info(f"Node [{self._identifier}] is overloaded, moved {moved} players to other nodes.")
+        return moved
 
     async def build_track(
         self,
@@ -348,9 +652,9 @@ class Node:
         Context object on the track it builds.
         """
 
-        async with self._session.get(
+        async with self._request(
+            "GET",
             f"{self._rest_uri}/" + NODE_VERSION + "/decodetrack?",
-            headers={"Authorization": self._password},
             params={"track": identifier}
         ) as resp:
             if not resp.status == 200:
@@ -361,6 +665,34 @@ class Node:
             data: dict = await resp.json()
             return Track(track_id=identifier, info=data, requester=requester)
 
+    async def _coalesce(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Runs the request once for concurrent callers sharing the same key.
+           Every caller awaits the same in-flight task, so identical lookups only hit the remote once.
+        """
+        pending = self._pool._pending_requests
+        if (task := pending.get(key)) is None:
+            task = pending[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: pending.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _fetch_tracks(self, query: str) -> dict:
+        async with self._request("GET", f"{self._rest_uri}/" + NODE_VERSION + f"/loadtracks?identifier={quote(query)}") as response:
+            return await response.json()
+
+    async def _load_tracks(self, query: str, *, search_type: SearchType = SearchType.YOUTUBE, cache: bool = False) -> dict:
+        """Fetches the raw loadtracks result from the node, using the shared track cache when enabled."""
+        key = (query if URL_REGEX.match(query) else " ".join(query.split()).lower(), search_type)
+        if cache and (data := self._pool._track_cache.get(key)) is not None:
+            return data
+
+        data: dict = await self._coalesce(("loadtracks", key), lambda: self._fetch_tracks(query))
+
+        if cache and data.get("loadType") in ("track", "playlist", "search"):
+            self._pool._track_cache[key] = data
+
+        return data
+
     async def get_tracks(
         self,
         query: str,
@@ -386,7 +718,7 @@ class Node:
 
         if SPOTIFY_URL_REGEX.match(query):
             try:
-                spotify_results = await self.spotify_client.search(query=query)
+                spotify_results = await self._coalesce(("spotify", query), lambda: self.spotify_client.search(query=query))
             except Exception as _:
                 raise TrackLoadError("Not able to find the provided Spotify entity, is it private?")
                 
@@ -420,11 +752,7 @@ class Node:
             )
 
         elif DISCORD_MP3_URL_REGEX.match(query):
-            async with self._session.get(
-                url=f"{self._rest_uri}/" + NODE_VERSION + f"/loadtracks?identifier={quote(query)}",
-                headers={"Authorization": self._password}
-            ) as response:
-                data: dict = await response.json()
+            data: dict = await self._load_tracks(query)
 
             try:
                 track: dict = data["data"]
@@ -439,11 +767,7 @@ class Node:
                 )
             ]
         else:
-            async with self._session.get(
-                url=f"{self._rest_uri}/" + NODE_VERSION + f"/loadtracks?identifier={quote(query)}",
-                headers={"Authorization": self._password}
-            ) as response:
-                data = await response.json()
+            data = await self._load_tracks(query, search_type=search_type, cache=True)
 
         load_type = data.get("loadType")
 
@@ -495,7 +819,7 @@ class Node:
                 "please obtain Spotify API credentials here: https://developer.spotify.com/"
             )
                 
-            tracks = await self._spotify_client.track_search(query=query)
+            tracks = await self._coalesce(("spotify_search", query), lambda: self._spotify_client.track_search(query=query))
         except Exception as _:
             raise TrackLoadError("Not able to find the provided Spotify entity, is it private?")
             
@@ -547,6 +871,8 @@ class NodePool:
     """
 
     _nodes: Dict[str, Node] = {}
+    _track_cache: LRUCache = LRUCache(max_size=1000, ttl=600)
+    _pending_requests: Dict[Hashable, asyncio.Future] = {}
 
     def __repr__(self):
         return f"<Voicelink.NodePool node_count={self.node_count}>"
@@ -559,6 +885,11 @@ class NodePool:
     @property
     def node_count(self) -> Optional[Node]:
         return len(self._nodes.values())
+
+    @property
+    def track_cache(self) -> LRUCache:
+        """Property which returns the track cache shared by every node in the pool."""
+        return self._track_cache
     
     @classmethod
     def get_best_node(cls, *, algorithm: NodeAlgorithm) -> Node:
@@ -574,20 +905,27 @@ class NodePool:
          Use NodeAlgorithm.BY_PLAYERS if you want to get the best node
          based on how players it has. This method will return a node with
          the least amount of players
+         Use NodeAlgorithm.BY_LOAD if you want to get the best node
+         based on the node's stats. This method will return a node with
+         the lowest penalty from cpu load, frame loss and playing players
         """
-        available_nodes = [node for node in cls._nodes.values() if node._available]
+        available_nodes = [node for node in cls._nodes.values() if node._available and not node._draining]
 
         if not available_nodes:
             raise NoNodesAvailable("There are no nodes available.")
 
         if algorithm == NodeAlgorithm.BY_PING:
-            tested_nodes = {node: node.latency for node in available_nodes}
+            tested_nodes = {node: node._latency if node._latency is not None else float("inf") for node in available_nodes}
             return min(tested_nodes, key=tested_nodes.get)
 
         elif algorithm == NodeAlgorithm.BY_PLAYERS:
             tested_nodes = {node: len(node.players.keys()) for node in available_nodes}
             return min(tested_nodes, key=tested_nodes.get)
 
+        elif algorithm == NodeAlgorithm.BY_LOAD:
+            tested_nodes = {node: node.penalty for node in available_nodes}
+            return min(tested_nodes, key=tested_nodes.get)
+
     @classmethod
     def get_node(cls, *, identifier: str = None) -> Node:
         """Fetches a node from the node pool using it's identifier.
@@ -595,7 +933,7 @@ class NodePool:
         """
 
         available_nodes = { node
-            for _, node in cls._nodes.items() if node.is_connected
+            for _, node in cls._nodes.items() if node.is_connected and not node._draining
         }
 
         if identifier:
@@ -622,22 +960,36 @@ class NodePool:
         spotify_client_secret: Optional[str] = None,
         session: Optional[aiohttp.ClientSession] = None,
         resume_key: Optional[str] = None,
+        resume_timeout: int = 60,
+        restore_concurrency: int = 10,
+        auto_rebalance: bool = False,
+        connection_limit: int = 100,
+        keepalive_timeout: float = 30,
+        dns_cache_ttl: int = 300,
+        request_timeout: float = 30,
         logger: Optional[logging.Logger] = None
     ) -> Node:
         """Creates a Node object to be then added into the node pool.
            For Spotify searching capabilites, pass in valid Spotify API credentials.
+           `resume_key` is deprecated and ignored, sessions are resumed with their session id.
         """
         if identifier in cls._nodes.keys():
             raise NodeCreationError(f"A node with identifier '{identifier}' already exists.")
         
         if not logger:
             logger = logging.getLogger("voicelink")
+
+        if resume_key is not None:
+            logger.warning(f"Node [{identifier}] The resume_key option is deprecated and has no effect, sessions are resumed with their session id.")
             
         node = Node(
             pool=cls, bot=bot, host=host, port=port, password=password,
             identifier=identifier, secure=secure, heartbeat=heartbeat, spotify_client_id=spotify_client_id, 
             session=session, spotify_client_secret=spotify_client_secret,
-            resume_key=resume_key, logger=logger
+            resume_timeout=resume_timeout,
+            restore_concurrency=restore_concurrency, auto_rebalance=auto_rebalance,
+            connection_limit=connection_limit, keepalive_timeout=keepalive_timeout,
+            dns_cache_ttl=dns_cache_ttl, request_timeout=request_timeout, logger=logger
         )
 
         await node.connect()
@@ -25,8 +25,11 @@ from .exceptions import QueueFull, OutofList
 from .objects import Track
 from .enums import LoopType
 
-from typing import Optional, Tuple, Callable, Dict, List
-from itertools import cycle
+from typing import Any, Hashable, Iterable, Iterator, Optional, Tuple, Callable, Dict, List, Union
+from bisect import bisect_right
+from collections import Counter
+from itertools import chain, cycle
+from operator import attrgetter
 from discord import Member
 
 class LoopTypeCycle:
@@ -51,6 +54,238 @@ class LoopTypeCycle:
     def __str__(self) -> str:
         return self.current.name.capitalize()
 
+class BlockList:
+    """A list split into blocks of bounded size.
+       Inserting or deleting at a position only shifts the items of a single block,
+       instead of every item behind the position like a plain list does.
+       With a `key`, every block also counts the keys of its items, so `find` only scans the blocks which contain a key.
+    """
+    BLOCK_SIZE: int = 256
+
+    def __init__(self, items: Iterable[Any] = (), key: Optional[Callable[[Any], Hashable]] = None) -> None:
+        self._key: Optional[Callable[[Any], Hashable]] = key
+        self._reset(list(items))
+
+    def _reset(self, items: List[Any]) -> None:
+        size = self.BLOCK_SIZE
+        self._blocks: List[List[Any]] = []
+        self._counts: List[Counter] = []
+        self._len: int = len(items)
+        self._replace_blocks(0, 0, [items[i:i + size] for i in range(0, len(items), size)])
+        self._update_offsets()
+
+    def _replace_blocks(self, start: int, stop: int, blocks: List[List[Any]]) -> None:
+        """Replaces the blocks in [start, stop) and keeps the key counts in step. The offsets are not updated."""
+        self._blocks[start:stop] = blocks
+        if self._key:
+            self._counts[start:stop] = [Counter(map(self._key, block)) for block in blocks]
+
+    def _count(self, block_index: int, items: Iterable[Any], sign: int = 1) -> None:
+        if self._key:
+            counts = self._counts[block_index]
+            for key in map(self._key, items):
+                if (count := counts[key] + sign) > 0:
+                    counts[key] = count
+                else:
+                    del counts[key]
+
+    def _split(self, block_index: int) -> None:
+        block = self._blocks[block_index]
+        if len(block) > self.BLOCK_SIZE * 2:
+            size = self.BLOCK_SIZE
+            self._replace_blocks(block_index, block_index + 1, [block[i:i + size] for i in range(0, len(block), size)])
+
+    def _update_offsets(self, start: int = 0) -> None:
+        if start == 0:
+            self._offsets: List[int] = []
+            total = 0
+        else:
+            del self._offsets[start:]
+            total = self._offsets[-1] + len(self._blocks[start - 1])
+
+        for block in self._blocks[start:]:
+            self._offsets.append(total)
+            total += len(block)
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("BlockList index out of range")
+        return index
+
+    def _locate(self, index: int) -> Tuple[int, int]:
+        block_index = bisect_right(self._offsets, index) - 1
+        return block_index, index - self._offsets[block_index]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(self._blocks)
+
+    def __repr__(self) -> str:
+        return f"<Voicelink.BlockList size={self._len} blocks={len(self._blocks)}>"
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                return list(self)[index]
+            if start >= stop:
+                return []
+
+            block_index, inner = self._locate(start)
+            result: List[Any] = []
+            while len(result) < stop - start:
+                block = self._blocks[block_index]
+                result.extend(block[inner:inner + stop - start - len(result)])
+                block_index, inner = block_index + 1, 0
+            return result
+
+        block_index, inner = self._locate(self._normalize(index))
+        return self._blocks[block_index][inner]
+
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                items = list(self)
+                items[index] = value
+                return self._reset(items)
+
+            value = list(value)
+            del self[start:max(start, stop)]
+            return self._insert_many(start, value)
+
+        block_index, inner = self._locate(self._normalize(index))
+        block = self._blocks[block_index]
+        self._count(block_index, (block[inner],), -1)
+        block[inner] = value
+        self._count(block_index, (value,))
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                items = list(self)
+                del items[index]
+                return self._reset(items)
+            if start >= stop:
+                return
+
+            # Trim the first and the last block, whole blocks in between are dropped
+            first, first_inner = self._locate(start)
+            last, last_inner = self._locate(stop - 1)
+            if first == last:
+                block = self._blocks[first]
+                self._count(first, block[first_inner:last_inner + 1], -1)
+                del block[first_inner:last_inner + 1]
+            else:
+                last_block, first_block = self._blocks[last], self._blocks[first]
+                self._count(last, last_block[:last_inner + 1], -1)
+                del last_block[:last_inner + 1]
+                self._count(first, first_block[first_inner:], -1)
+                del first_block[first_inner:]
+                self._replace_blocks(first + 1, last, [])
+            self._len -= stop - start
+
+            for block_index in (first + 1, first):
+                if block_index < len(self._blocks) and not self._blocks[block_index]:
+                    self._replace_blocks(block_index, block_index + 1, [])
+            return self._update_offsets(first)
+
+        block_index, inner = self._locate(self._normalize(index))
+        block = self._blocks[block_index]
+        self._count(block_index, (block.pop(inner),), -1)
+        self._len -= 1
+
+        if not block:
+            self._replace_blocks(block_index, block_index + 1, [])
+        self._update_offsets(block_index)
+
+    def _insert_many(self, index: int, items: List[Any]) -> None:
+        if not items:
+            return
+        if index >= self._len:
+            return self.extend(items)
+
+        block_index, inner = self._locate(index)
+        self._blocks[block_index][inner:inner] = items
+        self._count(block_index, items)
+        self._len += len(items)
+
+        self._split(block_index)
+        self._update_offsets(block_index)
+
+    def insert(self, index: int, item: Any) -> None:
+        if index < 0:
+            index = max(0, index + self._len)
+        index = min(index, self._len)
+
+        if not self._blocks:
+            self._replace_blocks(0, 0, [[item]])
+            self._len = 1
+            return self._update_offsets()
+
+        if index == self._len:
+            block_index, inner = len(self._blocks) - 1, len(self._blocks[-1])
+        else:
+            block_index, inner = self._locate(index)
+
+        self._blocks[block_index].insert(inner, item)
+        self._count(block_index, (item,))
+        self._len += 1
+
+        self._split(block_index)
+        self._update_offsets(block_index)
+
+    def append(self, item: Any) -> None:
+        self.insert(self._len, item)
+
+    def extend(self, items: Iterable[Any]) -> None:
+        items = list(items)
+        if not items:
+            return
+
+        start = len(self._blocks)
+        self._len += len(items)
+        if self._blocks and len(self._blocks[-1]) < self.BLOCK_SIZE:
+            start -= 1
+            room = self.BLOCK_SIZE - len(self._blocks[-1])
+            self._blocks[-1].extend(items[:room])
+            self._count(start, items[:room])
+            items = items[room:]
+
+        size = self.BLOCK_SIZE
+        self._replace_blocks(len(self._blocks), len(self._blocks), [items[i:i + size] for i in range(0, len(items), size)])
+        self._update_offsets(start)
+
+    def pop(self, index: int = -1) -> Any:
+        item = self[index]
+        del self[index]
+        return item
+
+    def find(self, key: Hashable, start: int = 0, stop: Optional[int] = None) -> Iterator[int]:
+        """Yields the indexes in [start, stop) of the items with the key, skipping the blocks without it."""
+        if not self._key:
+            raise TypeError("BlockList.find needs a key function")
+
+        start, stop, _ = slice(start, stop).indices(self._len)
+        if start >= stop:
+            return
+
+        first, _ = self._locate(start)
+        last, _ = self._locate(stop - 1)
+        for block_index in range(first, last + 1):
+            if key not in self._counts[block_index]:
+                continue
+
+            offset = self._offsets[block_index]
+            for inner, item in enumerate(self._blocks[block_index]):
+                if start <= offset + inner < stop and self._key(item) == key:
+                    yield offset + inner
+
 class Queue:
     def __init__(self, size: int, allow_duplicate: bool, get_msg: Callable[[str], str]) -> None:
         self._queue: List[Track] = []
@@ -59,9 +294,30 @@ class Queue:
         self._repeat: LoopTypeCycle = LoopTypeCycle()
         self._repeat_position: int = 0
         self._allow_duplicate: bool = allow_duplicate
+        self._uris: Counter = Counter()
 
         self.get_msg = get_msg
 
+    def _on_added(self, tracks: Iterable[Track]) -> None:
+        """Called after tracks are added to the queue."""
+        self._uris.update(track.uri for track in tracks)
+
+    def _on_removed(self, tracks: Iterable[Track]) -> None:
+        """Called after tracks are removed from the queue."""
+        for track in tracks:
+            if (count := self._uris[track.uri]) > 1:
+                self._uris[track.uri] = count - 1
+            else:
+                del self._uris[track.uri]
+
+    def _requester_indexes(self, member: Member, start: int, stop: int) -> Iterator[int]:
+        """Yields the indexes in [start, stop) of the tracks requested by the member."""
+        return (i for i, track in zip(range(start, stop), self._queue[start:stop]) if track.requester == member)
+
+    def has_uri(self, uri: str) -> bool:
+        """Checks whether a track with the uri is in the queue, including the history."""
+        return uri in self._uris
+
     def get(self) -> Optional[Track]:
         track = None
         try:
@@ -83,6 +339,7 @@ class Queue:
             raise QueueFull(self.get_msg("voicelinkQueueFull").format(self._size))
 
         self._queue.append(item)
+        self._on_added((item,))
         return self.count
 
     def put_at_front(self, item: Track) -> int:
@@ -90,13 +347,36 @@ class Queue:
             raise QueueFull(self.get_msg("voicelinkQueueFull").format(self._size))
 
         self._queue.insert(self._position, item)
+        self._on_added((item,))
         return 1
 
     def put_at_index(self, index: int, item: Track) -> None:
         if self.count >= self._size:
             raise QueueFull(self.get_msg("voicelinkQueueFull").format(self._size))
 
-        return self._queue.insert(self._position - 1 + index, item)
+        self._queue.insert(self._position - 1 + index, item)
+        self._on_added((item,))
+
+    def put_many(self, items: List[Track], at: Optional[int] = None) -> int:
+        """Adds the tracks in one splice and returns how many of them were added.
+           `at` is an index in the upcoming tracks, tracks are appended to the end if it is None.
+           Tracks which don't fit into the queue anymore are skipped.
+        """
+        if not items:
+            return 0
+
+        if (room := self._size - self.count) <= 0:
+            raise QueueFull(self.get_msg("voicelinkQueueFull").format(self._size))
+
+        items = items[:room]
+        if at is None:
+            self._queue.extend(items)
+        else:
+            index = self._position + max(at, 0)
+            self._queue[index:index] = items
+
+        self._on_added(items)
+        return len(items)
 
     def skipto(self, index: int) -> None:
         if not 0 < index <= self.count:
@@ -111,18 +391,27 @@ class Queue:
             self._position -= index
 
     def history_clear(self, is_playing: bool) -> None:
-        self._queue[:self._position - 1 if is_playing else self._position] = []
+        end = self._position - 1 if is_playing else self._position
+        removed = self._queue[:end]
+        del self._queue[:end]
         self._position = 1 if is_playing else 0
+        self._on_removed(removed)
 
     def clear(self) -> None:
+        removed = self._queue[self._position:]
         del self._queue[self._position:]
+        self._on_removed(removed)
 
     def replace(self, queue_type: str, replacement: list) -> None:
         if queue_type == "queue":
             self.clear()
-            self._queue += replacement
+            self._queue.extend(replacement)
+            self._on_added(replacement)
         elif queue_type == "history":
+            removed = self._queue[:self._position]
             self._queue[:self._position] = replacement
+            self._on_removed(removed)
+            self._on_added(replacement)
 
     def swap(self, track_index1: int, track_index2: int) -> Tuple[Track, Track]:
         try:
@@ -137,9 +426,8 @@ class Queue:
             raise OutofList(self.get_msg("voicelinkOutofList"))
 
         try:
-            item = self._queue[self._position + target - 1]
-            self._queue.remove(item)
-            self.put_at_index(to, item)
+            item = self._queue.pop(self._position + target - 1)
+            self._queue.insert(self._position - 1 + to, item)
             return item
         except:
             raise OutofList(self.get_msg("voicelinkOutofList"))
@@ -154,14 +442,19 @@ class Queue:
             index, index2 = index2, index
 
         try:
-            removed_tracks: Dict[str, Track] = {}
-            for i, track in enumerate(self._queue[pos + index: pos + index2 + 1]):
-                if member and track.requester != member:
-                    continue
-            
-                self._queue.remove(track)
-                removed_tracks[pos + index + i] = track
-
+            start, stop, _ = slice(pos + index, pos + index2 + 1).indices(len(self._queue))
+            removed_tracks: Dict[int, Track] = (
+                {i: self._queue[i] for i in self._requester_indexes(member, start, stop)} if member
+                else dict(zip(range(start, stop), self._queue[start:stop]))
+            )
+
+            if member:
+                for i in reversed(removed_tracks):
+                    del self._queue[i]
+            else:
+                del self._queue[start:stop]
+
+            self._on_removed(removed_tracks.values())
             return removed_tracks
         except:
             raise OutofList(self.get_msg("voicelinkOutofList"))
@@ -178,7 +471,7 @@ class Queue:
 
     @property
     def count(self) -> int:
-        return len(self._queue[self._position:])
+        return max(len(self._queue) - self._position, 0)
     
     @property
     def repeat(self) -> str:
@@ -192,27 +485,98 @@ class Queue:
             return True
         return False
 
-class FairQueue(Queue):
-    def __init__(self, size: int, allow_duplicate: bool, get_msg) -> None:
+class IndexedQueue(Queue):
+    """A queue backed by a block list, for guilds with very large queues.
+       Inserting, moving and removing tracks only shifts a single block.
+       The tracks are indexed by requester per block, so removing the tracks of a member only scans the blocks which contain them.
+    """
+    def __init__(self, size: int, allow_duplicate: bool, get_msg: Callable[[str], str]) -> None:
         super().__init__(size, allow_duplicate, get_msg)
-        self._set = set()
+        self._queue: BlockList = BlockList(key=attrgetter("requester"))
+        self._requesters: Counter[Member] = Counter()
+
+    def _on_added(self, tracks: Iterable[Track]) -> None:
+        super()._on_added(tracks)
+        self._requesters.update(track.requester for track in tracks)
+
+    def _on_removed(self, tracks: Iterable[Track]) -> None:
+        super()._on_removed(tracks)
+        self._requesters.subtract(track.requester for track in tracks)
+        for requester in [requester for requester, count in self._requesters.items() if count <= 0]:
+            del self._requesters[requester]
+
+    def requester_count(self, member: Member) -> int:
+        """Returns how many tracks in the queue and history were requested by the member."""
+        return self._requesters.get(member, 0)
+
+    def _requester_indexes(self, member: Member, start: int, stop: int) -> Iterator[int]:
+        if not self.requester_count(member):
+            return iter(())
+        return self._queue.find(member, start, stop)
+
+class FairQueue(Queue):
+    """A queue which interleaves the tracks of different requesters.
+       The n-th upcoming track of every requester plays in round n and the rounds follow one after another,
+       so a long playlist from one member does not push back the tracks of everyone else.
+    """
+    def _fair_merge(self, items: List[Track]) -> List[int]:
+        """Splices the items into the upcoming tracks in a single pass and returns their new indexes."""
+        start = max(self._position - 1, 0)
+        upcoming = self._queue[start:]
+
+        # turn_ends[n] is the index of the last upcoming track that plays in round n or earlier
+        counts: Dict[Member, int] = {}
+        turn_ends: List[int] = []
+        for index, track in enumerate(upcoming):
+            turn = counts.get(track.requester, 0)
+            counts[track.requester] = turn + 1
+            if turn == len(turn_ends):
+                turn_ends.append(index)
+            else:
+                turn_ends[turn] = index
+
+        for turn in range(1, len(turn_ends)):
+            turn_ends[turn] = max(turn_ends[turn], turn_ends[turn - 1])
+
+        groups: Dict[int, List[Tuple[int, int, Track]]] = {}
+        for order, item in enumerate(items):
+            turn = counts.get(item.requester, 0)
+            counts[item.requester] = turn + 1
+            anchor = turn_ends[turn] if turn < len(turn_ends) else len(upcoming) - 1
+            groups.setdefault(anchor, []).append((turn, order, item))
+
+        merged: List[Track] = []
+        positions: List[int] = [0] * len(items)
+        for index in range(-1, len(upcoming)):
+            if index >= 0:
+                merged.append(upcoming[index])
+            for _, order, item in sorted(groups.get(index, ()), key=lambda group: group[:2]):
+                positions[order] = len(merged)
+                merged.append(item)
+
+        del self._queue[start:]
+        self._queue.extend(merged)
+        return positions
+
+    def put_many(self, items: List[Track], at: Optional[int] = None) -> int:
+        """Adds the tracks in fair order and returns how many of them were added.
+           Tracks placed at an explicit index skip the fair order.
+        """
+        if at is not None or not items:
+            return super().put_many(items, at)
+
+        if (room := self._size - self.count) <= 0:
+            raise QueueFull(self.get_msg("voicelinkQueueFull").format(self._size))
+
+        items = items[:room]
+        self._fair_merge(items)
+        self._on_added(items)
+        return len(items)
 
     def put(self, item: Track) -> int:
-        if len(self._queue) >= self._size:
+        if self.count >= self._size:
             raise QueueFull(self.get_msg("voicelinkQueueFull").format(self._size))
 
-        tracks = self.tracks(incTrack=True)
-        lastIndex = len(tracks)
-        for track in reversed(tracks):
-            if track.requester == item.requester:
-                break
-            lastIndex -= 1
-        self._set.clear()
-        for track in tracks[lastIndex:]:
-            if track.requester in self._set:
-                break
-            lastIndex += 1
-            self._set.add(track.requester)
-
-        self.put_at_index(lastIndex, item)
-        return lastIndex
+        position = self._fair_merge([item])[0]
+        self._on_added((item,))
+        return position
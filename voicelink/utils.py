@@ -21,6 +21,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
 import random
 import time
 import socket
@@ -35,7 +36,8 @@ __all__ = [
     "NodeInfoVersion",
     "NodeInfo",
     "Plugin",
-    "Ping"
+    "Ping",
+    "RequestStats"
 ]
 
 class ExponentialBackoff:
@@ -108,6 +110,23 @@ class NodeStats:
         self.players_total: int = data.get("players")
         self.uptime: int = data.get("uptime")
 
+        frame_stats: Dict = data.get("frameStats") or {}
+        self.frames_sent: int = frame_stats.get("sent", 0)
+        self.frames_nulled: int = frame_stats.get("nulled", 0)
+        self.frames_deficit: int = frame_stats.get("deficit", 0)
+
+    @property
+    def penalty(self) -> float:
+        """The load score of the node, calculated the same way as Lavalink's reference clients.
+           A lower value means the node is less loaded.
+        """
+        player_penalty = self.players_active or 0
+        cpu_penalty = 1.05 ** (100 * (self.cpu_system_load or 0)) * 10 - 10
+        deficit_frame_penalty = 1.03 ** (500 * (self.frames_deficit / 3000)) * 600 - 600
+        null_frame_penalty = (1.03 ** (500 * (self.frames_nulled / 3000)) * 300 - 300) * 2
+
+        return player_penalty + cpu_penalty + deficit_frame_penalty + null_frame_penalty
+
     def __repr__(self) -> str:
         return f"<Voicelink.NodeStats total_players={self.players_total!r} playing_active={self.players_active!r}>"
 
@@ -205,3 +224,56 @@ class Ping:
 
         return s_runtime
 
+    async def get_ping_async(self) -> float:
+        """Measures the TCP connect time without blocking the event loop."""
+        self.timer.start()
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(self._host, int(self._port)), timeout=self._timeout
+        )
+        self.timer.stop()
+
+        writer.close()
+        return 1000 * (self.timer._stop - self.timer._start)
+
+class RequestStats:
+    """Keeps a latency histogram and the in-flight count of the REST requests sent to a node."""
+    BUCKETS: tuple[float, ...] = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float("inf"))
+
+    def __init__(self) -> None:
+        self.in_flight: int = 0
+        self.total: int = 0
+        self.errors: int = 0
+        self.total_time: float = 0.0
+        self.histogram: list[int] = [0] * len(self.BUCKETS)
+
+    def __repr__(self) -> str:
+        return f"<Voicelink.RequestStats total={self.total} in_flight={self.in_flight} errors={self.errors}>"
+
+    def observe(self, elapsed: float, *, failed: bool = False) -> None:
+        """Records a finished request which took `elapsed` milliseconds."""
+        self.total += 1
+        self.total_time += elapsed
+        if failed:
+            self.errors += 1
+
+        for index, bound in enumerate(self.BUCKETS):
+            if elapsed <= bound:
+                self.histogram[index] += 1
+                break
+
+    def percentile(self, percent: float) -> float:
+        """Returns the upper bound of the bucket which contains the given percentile."""
+        if not self.total:
+            return 0.0
+
+        target, count = self.total * percent / 100, 0
+        for bound, amount in zip(self.BUCKETS, self.histogram):
+            count += amount
+            if count >= target:
+                return bound
+
+        return self.BUCKETS[-1]
+
+    @property
+    def average(self) -> float:
+        return self.total_time / self.total if self.total else 0.0